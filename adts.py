@@ -1,16 +1,61 @@
 """
-Basic Abstract data types : Stack, List, Queue and their
-implementations at basic level
+Basic Abstract data types : Stack, List, Queue, PriorityQueue and their
+implementations at basic level.
+Every ADT is a Container, so it can be iterated over, searched with in,
+and printed. Bulk operations have default implementations in terms of the
+single item ones, which implementations override with faster versions.
+PROFILED_METHODS names the methods the profiling module can instrument
 """
 
 __author__ = "Sadeeptha Bandara"
 
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import TypeVar, Generic
 T = TypeVar('T')
 
+RENDER_LIMIT = 1000
 
-class Stack(ABC, Generic[T]):
+
+def render(items, length: int = None, to_string=str, limit: int = RENDER_LIMIT) -> str:
+    """
+    Renders items as [a, b, c]. Only the first limit items are rendered,
+    followed by the number of items left out if length is known
+    :complexity: O(min(n, limit))
+    """
+    strings = [to_string(item) for item in islice(items, limit + 1)]
+    if len(strings) > limit:
+        strings[limit] = "..." if length is None else "... {} more".format(length - limit)
+    return "[" + ", ".join(strings) + "]"
+
+
+class Container(ABC, Generic[T]):
+    """
+    Iterate
+    Contains?
+    String representation
+    """
+    @abstractmethod
+    def __iter__(self):
+        pass
+
+    def __contains__(self, item: T) -> bool:
+        """
+        :complexity: O(n)
+        """
+        for element in self:
+            if element == item:
+                return True
+        return False
+
+    def __str__(self):
+        return render(self, len(self))
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, render(self, len(self), repr))
+
+
+class Stack(Container[T]):
     """
      Pop
      Push
@@ -19,6 +64,8 @@ class Stack(ABC, Generic[T]):
      Is full?
      length
     """
+    PROFILED_METHODS = ("push", "push_many", "pop", "peek", "_resize")
+
     def __init__(self) -> None:
         self.length = 0
 
@@ -45,6 +92,13 @@ class Stack(ABC, Generic[T]):
         """
         pass
 
+    def push_many(self, items) -> None:
+        """
+        Push all items in order, so the last one ends up on top
+        """
+        for item in items:
+            self.push(item)
+
     @abstractmethod
     def is_full(self) -> bool:
         pass
@@ -62,7 +116,7 @@ class Stack(ABC, Generic[T]):
         return len(self) == 0
 
 
-class Queue(ABC, Generic[T]):
+class Queue(Container[T]):
     """
     Serve
     Append
@@ -71,6 +125,8 @@ class Queue(ABC, Generic[T]):
     Is full?
     length
     """
+    PROFILED_METHODS = ("append", "extend", "serve", "serve_many", "_resize")
+
     def __init__(self):
         self.length = 0
 
@@ -89,6 +145,24 @@ class Queue(ABC, Generic[T]):
         """
         pass
 
+    def extend(self, items) -> None:
+        """
+        Append all items in order
+        """
+        for item in items:
+            self.append(item)
+
+    def serve_many(self, count: int) -> list:
+        """
+        Serve count items from the start of the queue
+        :return: List of the items, in the order served
+        """
+        if count < 0:
+            raise ValueError("Count must be non-negative")
+        if count > len(self):
+            raise IndexError("Queue has fewer than {} items".format(count))
+        return [self.serve() for _ in range(count)]
+
     @abstractmethod
     def is_full(self) -> bool:
         pass
@@ -106,7 +180,7 @@ class Queue(ABC, Generic[T]):
         self.length = 0
 
 
-class List(ABC, Generic[T]):
+class List(Container[T]):
     """
     Getter
     Setter
@@ -118,6 +192,8 @@ class List(ABC, Generic[T]):
     Is empty?
     Length
     """
+    PROFILED_METHODS = ("insert", "append", "extend", "index", "delete_at_index", "remove", "_resize")
+
     def __init__(self) -> None:
         self.length = 0
 
@@ -146,6 +222,13 @@ class List(ABC, Generic[T]):
         """
         pass
 
+    def extend(self, items) -> None:
+        """
+        Insert all items at the end of the list, in order
+        """
+        for item in items:
+            self.append(item)
+
     @abstractmethod
     def index(self, item: T) -> int:
         """
@@ -171,6 +254,14 @@ class List(ABC, Generic[T]):
         index = self.index(item)
         self.delete_at_index(index)
 
+    def __iter__(self):
+        """
+        Yields the items by index. Implementations that cannot index
+        in O(1) should override this
+        """
+        for i in range(len(self)):
+            yield self[i]
+
     def clear(self) -> None:
         self.length = 0
 
@@ -181,7 +272,9 @@ class List(ABC, Generic[T]):
         return self.length
 
 
-class SortedList(ABC, Generic[T]):
+class SortedList(Container[T]):
+    PROFILED_METHODS = ("add", "add_many", "index", "delete_at_index", "remove", "_resize")
+
     def __init__(self):
         self.length = 0
 
@@ -193,6 +286,10 @@ class SortedList(ABC, Generic[T]):
     def add(self, item: T) -> None:
         pass
 
+    def add_many(self, items) -> None:
+        for item in items:
+            self.add(item)
+
     @abstractmethod
     def index(self, item: T) -> int:
         pass
@@ -205,6 +302,20 @@ class SortedList(ABC, Generic[T]):
         index = self.index(item)
         self.delete_at_index(index)
 
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __contains__(self, item: T) -> bool:
+        """
+        :complexity: That of index
+        """
+        try:
+            self.index(item)
+        except KeyError:
+            return False
+        return True
+
     def __len__(self):
         return self.length
 
@@ -215,5 +326,66 @@ class SortedList(ABC, Generic[T]):
         self.length = 0
 
 
+class PriorityQueue(Container[T]):
+    """
+    Push with priority
+    Pop item with lowest priority
+    Peek
+    Update priority
+    Clear
+    Is empty?
+    length
+    """
+    PROFILED_METHODS = ("push", "push_many", "pop", "peek", "update", "_resize")
+
+    def __init__(self) -> None:
+        self.length = 0
+
+    @abstractmethod
+    def push(self, item: T, priority) -> None:
+        """
+        Add item to the queue with the given priority
+        """
+        pass
+
+    @abstractmethod
+    def pop(self) -> T:
+        """
+        Remove and return the item with the lowest priority
+        :return: Item
+        """
+        pass
+
+    @abstractmethod
+    def peek(self) -> T:
+        """
+        Return the item with the lowest priority, without removing it
+        :return: Item
+        """
+        pass
 
+    @abstractmethod
+    def update(self, item: T, priority) -> None:
+        """
+        Change the priority of an item already in the queue
+        """
+        pass
 
+    def push_many(self, entries) -> None:
+        """
+        Push every (item, priority) pair
+        """
+        for item, priority in entries:
+            self.push(item, priority)
+
+    def clear(self) -> None:
+        """
+        Clears the queue
+        """
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
@@ -1,13 +1,23 @@
 """
 Array implementations of ADTs
 Contains
-- Lists, Queues, Stacks
+- Lists, Queues, Stacks, Heaps
+Pickling keeps only the live items, never the spare capacity of an array
 """
 
 __author__ = "Sadeeptha Bandara"
 
+import array as pyarray
+import pickle
+from itertools import chain, islice
 from typing import TypeVar
-from adts import Stack, Queue, List, SortedList
+from adts import Stack, Queue, List, SortedList, PriorityQueue
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 T = TypeVar('T')
 
 
@@ -36,6 +46,18 @@ class ArrayStack(Stack[T]):
         self.array[len(self)] = item
         self.length += 1
 
+    def push_many(self, items) -> None:
+        """
+        Push all items in order with a single slice assignment.
+        Nothing is pushed if they do not all fit
+        :complexity: O(k) where k is the number of items
+        """
+        items = list(items)
+        if len(self) + len(items) > len(self.array):
+            raise IndexError("Stack is full. Pop or clear items to proceed")
+        self.array[len(self):len(self) + len(items)] = items
+        self.length += len(items)
+
     def pop(self) -> T:
         """
         complexity: O(1)
@@ -58,6 +80,18 @@ class ArrayStack(Stack[T]):
         """
         return len(self.array) == len(self)
 
+    def __iter__(self):
+        """
+        Yields the items from the bottom of the stack to the top
+        """
+        return islice(self.array, len(self))
+
+    def __reduce_ex__(self, protocol: int):
+        return type(self), (len(self.array),), self.array[:len(self)]
+
+    def __setstate__(self, items: list) -> None:
+        self.push_many(items)
+
 
 # Queue : Linear
 # ==============================================================
@@ -90,6 +124,22 @@ class LinearQueue(Queue[T]):
         self.rear += 1
         self.length += 1
 
+    def extend(self, items) -> None:
+        """
+        Append all items in order, resizing at most once
+        :complexity: O(k) where k is the number of items,
+        with resize O(n) where n is the size of the larger array
+        """
+        items = list(items)
+        if self.rear + len(items) > len(self.array):
+            factor = 2
+            while max(len(self.array), 1) * factor < len(self) + len(items):
+                factor *= 2
+            self._resize(factor)
+        self.array[self.rear:self.rear + len(items)] = items
+        self.rear += len(items)
+        self.length += len(items)
+
     def serve(self) -> T:
         """
         :complexity: O(1)
@@ -101,6 +151,19 @@ class LinearQueue(Queue[T]):
         self.length -= 1
         return item
 
+    def serve_many(self, count: int) -> list:
+        """
+        :complexity: O(k) where k is the count
+        """
+        if count < 0:
+            raise ValueError("Count must be non-negative")
+        if count > len(self):
+            raise IndexError("Queue has fewer than {} items".format(count))
+        items = self.array[self.front:self.front + count]
+        self.front += count
+        self.length -= count
+        return items
+
     def _resize(self, factor: int = 2) -> None:
         """
         Creates new array with size larger than original, by the factor.
@@ -123,12 +186,20 @@ class LinearQueue(Queue[T]):
         """
         return self.rear == len(self.array)
 
-    def __str__(self):
-        return_string = "["
-        for i in range(self.front, self.rear):
-            return_string += str(self.array[i]) + ", "
-        return_string += "]"
-        return return_string
+    def __iter__(self):
+        """
+        Yields the items from the front of the queue to the rear
+        """
+        return islice(self.array, self.front, self.rear)
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Served slots before the front are left out
+        """
+        return type(self), (max(len(self), 1),), self.array[self.front:self.rear]
+
+    def __setstate__(self, items: list) -> None:
+        self.extend(items)
 
     def clear(self) -> None:
         Queue.clear(self)
@@ -158,6 +229,26 @@ class CircularQueue(Queue[T]):
         self.rear = (self.rear + 1) % len(self.array)
         self.length += 1
 
+    def extend(self, items) -> None:
+        """
+        Append all items in order, resizing at most once
+        :complexity: O(k) where k is the number of items,
+        with resize O(n) where n is the size of the larger array
+        """
+        items = list(items)
+        if not items:
+            return
+        if len(self) + len(items) > len(self.array):
+            factor = 2
+            while max(len(self.array), 1) * factor < len(self) + len(items):
+                factor *= 2
+            self._resize(factor)
+        split = min(len(items), len(self.array) - self.rear)
+        self.array[self.rear:self.rear + split] = items[:split]
+        self.array[:len(items) - split] = items[split:]
+        self.rear = (self.rear + len(items)) % len(self.array)
+        self.length += len(items)
+
     def serve(self) -> T:
         """
         :complexity: O(1)
@@ -169,6 +260,24 @@ class CircularQueue(Queue[T]):
         self.length -= 1
         return item
 
+    def serve_many(self, count: int) -> list:
+        """
+        Serves count items with at most two slices, one either side of the wrap
+        :complexity: O(k) where k is the count
+        """
+        if count < 0:
+            raise ValueError("Count must be non-negative")
+        if count > len(self):
+            raise IndexError("Queue has fewer than {} items".format(count))
+        stop = self.front + count
+        items = self.array[self.front:stop]
+        if stop > len(self.array):
+            items += self.array[:stop - len(self.array)]
+        if count:
+            self.front = stop % len(self.array)
+        self.length -= count
+        return items
+
     def _resize(self, factor: int = 2) -> None:
         """
         Creates new array with size larger than original, by the factor.
@@ -191,14 +300,22 @@ class CircularQueue(Queue[T]):
         """
         return len(self) == len(self.array)
 
-    def __str__(self):
-        return_string = "["
-        index = self.front
-        for i in range(len(self)):
-            return_string += str(self.array[index]) + ", "
-            index = (index + 1) % len(self.array)
-        return_string += "]"
-        return return_string
+    def __iter__(self):
+        """
+        Yields the items from the front of the queue to the rear
+        """
+        stop = self.front + len(self)
+        return chain(islice(self.array, self.front, min(stop, len(self.array))),
+                     islice(self.array, max(stop - len(self.array), 0)))
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        The items are unwrapped into a single list from front to rear
+        """
+        return type(self), (max(len(self), 1),), list(self)
+
+    def __setstate__(self, items: list) -> None:
+        self.extend(items)
 
     def clear(self) -> None:
         Queue.clear(self)
@@ -207,11 +324,46 @@ class CircularQueue(Queue[T]):
 
 
 class ArrayList(List[T]):
+    """
+    List implementation with array. Uses resizing.
+    Items are moved with slice assignment, so shifting the tail on
+    insert or delete is a single block move rather than a Python loop.
+    If a typecode is given (see the array module), the backing store is a
+    typed array.array and the live items can be exported with view()
+    """
     DEFAULT_LENGTH = 6
+    PROFILED_METHODS = List.PROFILED_METHODS + ("insert_many",)
 
-    def __init__(self, length: int = DEFAULT_LENGTH):
+    def __init__(self, length: int = DEFAULT_LENGTH, typecode: str = None):
+        """
+        :param length: Initial capacity
+        :param typecode: Optional array module typecode for numeric items
+        :complexity: O(n) where n is the length
+        """
         List.__init__(self)
-        self.array = [None] * length
+        self.typecode = typecode
+        self.array = self._new_array(length)
+
+    def _new_array(self, length: int):
+        """
+        Creates an empty backing array of the given capacity
+        """
+        if self.typecode is None:
+            return [None] * length
+        return pyarray.array(self.typecode, bytes(length * pyarray.array(self.typecode).itemsize))
+
+    def _as_array(self, items):
+        """
+        Converts a sequence of items to the type of the backing array,
+        so that it can be used on the right hand side of a slice assignment.
+        The backing array itself is copied, as shifting the tail would
+        overwrite it before it is read
+        """
+        if self.typecode is None:
+            return items if isinstance(items, list) and items is not self.array else list(items)
+        if isinstance(items, pyarray.array) and items is not self.array:
+            return items
+        return pyarray.array(self.typecode, items)
 
     def __setitem__(self, index: int, item: T):
         """
@@ -221,37 +373,55 @@ class ArrayList(List[T]):
             raise IndexError("Index is out of bounds")
         self.array[index] = item
 
-    def __getitem__(self, index: int):
-        """
-        :complexity: O(1)
-        """
+    def __getitem__(self, index):
+        """
+        Returns the item at index, or a new ArrayList for a slice
+        :complexity: O(1), O(k) for a slice of k items
+        """
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            if positions:
+                stop = positions.stop if positions.stop >= 0 else None
+                items = self.array[positions.start:stop:positions.step]
+            else:
+                items = self.array[0:0]
+            result = ArrayList(len(items), self.typecode)
+            result.extend(items)
+            return result
         if index >= len(self):
             raise IndexError("Index is out of bounds")
         return self.array[index]
 
-    # IMPROVE
     def insert(self, index: int, item: T) -> None:
         """
         Insert item at specified index
         :complexity: O(n)
         """
+        if index > len(self):
+            raise IndexError("Index is out of bounds")
         if len(self) == len(self.array):
             self._resize()
-
-        array = [None] * (len(self) - index)
-        ind = 0
-        for i in range(index, len(self)):
-            array[ind] = self.array[i]
-            ind += 1
-
-        ind = 0
-        for i in range(index + 1, len(self) + 1):
-            self.array[i] = array[ind]
-            ind += 1
-
+        self.array[index + 1:len(self) + 1] = self.array[index:len(self)]
         self.array[index] = item
         self.length += 1
 
+    def insert_many(self, index: int, items) -> None:
+        """
+        Insert all items, in order, starting at the specified index.
+        The tail is shifted once, regardless of the number of items
+        :complexity: O(n + k) where k is the number of items
+        """
+        if index > len(self):
+            raise IndexError("Index is out of bounds")
+        items = self._as_array(items)
+        count = len(items)
+        if count == 0:
+            return
+        self._ensure_capacity(len(self) + count)
+        self.array[index + count:len(self) + count] = self.array[index:len(self)]
+        self.array[index:index + count] = items
+        self.length += count
+
     def append(self, item: T) -> None:
         """
         Insert item to final index
@@ -263,10 +433,37 @@ class ArrayList(List[T]):
         self.array[len(self)] = item
         self.length += 1
 
+    def extend(self, items) -> None:
+        """
+        Append all items to the end of the list, resizing at most once
+        :complexity: O(k) where k is the number of items
+        """
+        items = self._as_array(items)
+        count = len(items)
+        if count == 0:
+            return
+        self._ensure_capacity(len(self) + count)
+        self.array[len(self):len(self) + count] = items
+        self.length += count
+
+    def _ensure_capacity(self, capacity: int) -> None:
+        """
+        Resizes until the array can hold at least capacity items
+        """
+        if capacity <= len(self.array):
+            return
+        factor = 2
+        while max(len(self.array), 1) * factor < capacity:
+            factor *= 2
+        self._resize(factor)
+
     def _resize(self, factor: int = 2):
-        array = [None] * len(self.array) * factor
-        for i in range(len(self)):
-            array[i] = self.array[i]
+        """
+        Creates new array with size larger than original, by the factor.
+        :complexity: O(n)
+        """
+        array = self._new_array(max(len(self.array), 1) * factor)
+        array[:len(self)] = self.array[:len(self)]
         self.array = array
 
     def index(self, item: T) -> int:
@@ -276,16 +473,185 @@ class ArrayList(List[T]):
         raise KeyError("Item not found")
 
     def delete_at_index(self, index: int) -> T:
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i+1]
+        """
+        Delete item at index, shifting the tail down by one
+        :complexity: O(n)
+        """
+        if index >= len(self):
+            raise IndexError("Index is out of bounds")
+        item = self.array[index]
+        self.array[index:len(self) - 1] = self.array[index + 1:len(self)]
         self.length -= 1
+        if self.typecode is None:
+            self.array[len(self)] = None
+        return item
 
-    def __str__(self):
-        return_string = "["
-        for i in range(len(self)):
-            return_string += str(self.array[i]) + ", "
-        return_string += "]"
-        return return_string
+    def view(self) -> memoryview:
+        """
+        Returns a memoryview over the live items of a typed ArrayList,
+        without copying. Can be passed to numpy.frombuffer or file.write.
+        This is the only zero-copy export: ArrayList does not implement the
+        buffer protocol itself, as Python classes can only do so from 3.12.
+        The view refers to the current backing array, so it will not
+        reflect items added after a resize
+        """
+        if self.typecode is None:
+            raise TypeError("Only an ArrayList with a typecode can be viewed")
+        return memoryview(self.array)[:len(self)]
+
+    def __iter__(self):
+        return islice(self.array, len(self))
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Typed items are pickled as raw bytes. With protocol 5 they are
+        passed as a PickleBuffer over the backing array, so a pickler with
+        a buffer_callback can send them out-of-band without copying
+        """
+        if self.typecode is None:
+            items = self.array[:len(self)]
+        elif protocol >= 5:
+            items = pickle.PickleBuffer(self.view())
+        else:
+            items = self.view().tobytes()
+        return type(self), self._reduce_args(), items
+
+    def _reduce_args(self) -> tuple:
+        return 0, self.typecode
+
+    def __setstate__(self, items) -> None:
+        """
+        The unpickled items become the backing array, with no spare capacity
+        """
+        self.array = self._as_array(items) if self.typecode is None else self._from_bytes(items)
+        self.length = len(self.array)
+
+    def _from_bytes(self, data):
+        """
+        Copies the unpickled buffer into a typed array. An out-of-band
+        buffer may keep the item format, so it is cast to bytes first
+        """
+        array = self._new_array(0)
+        array.frombytes(memoryview(data).cast("B"))
+        return array
+
+
+class NumpyArrayList(ArrayList[T]):
+    """
+    ArrayList for numeric items, backed by a numpy array of a fixed dtype.
+    Stores 8 bytes per int64 item instead of a pointer to a boxed int,
+    and runs searches and aggregations as vectorized numpy operations.
+    typecode holds the numpy dtype character
+    """
+    DEFAULT_DTYPE = "int64"
+    ITER_CHUNK = 4096
+
+    def __init__(self, length: int = ArrayList.DEFAULT_LENGTH, dtype=DEFAULT_DTYPE):
+        """
+        :param length: Initial capacity
+        :param dtype: numpy dtype of the items
+        :complexity: O(n) where n is the length
+        """
+        if np is None:
+            raise ImportError("NumpyArrayList requires numpy")
+        self.dtype = np.dtype(dtype)
+        ArrayList.__init__(self, length, self.dtype.char)
+
+    def _new_array(self, length: int):
+        return np.zeros(length, dtype=self.dtype)
+
+    def _as_array(self, items):
+        """
+        Items that may overlap the backing array, such as a slice of
+        as_numpy(), are copied, so shifting the tail cannot overwrite them
+        """
+        if not isinstance(items, np.ndarray) and not hasattr(items, "__len__"):
+            items = list(items)
+        items = np.asarray(items, dtype=self.dtype)
+        if np.may_share_memory(items, self.array):
+            items = items.copy()
+        return items
+
+    def _reduce_args(self) -> tuple:
+        return 0, self.dtype
+
+    def _from_bytes(self, data):
+        """
+        Wraps the unpickled buffer without copying it, unless it is read only
+        """
+        array = np.frombuffer(data, dtype=self.dtype)
+        return array if array.flags.writeable else array.copy()
+
+    def __getitem__(self, index):
+        """
+        Returns the item at index, or a new NumpyArrayList for a slice
+        :complexity: O(1), O(k) for a slice of k items
+        """
+        if isinstance(index, slice):
+            items = self.as_numpy()[index]
+            result = NumpyArrayList(len(items), self.dtype)
+            result.extend(items)
+            return result
+        return ArrayList.__getitem__(self, index)
+
+    def as_numpy(self):
+        """
+        Returns a numpy view over the live items, without copying.
+        The view refers to the current backing array, so it will not
+        reflect items added after a resize
+        """
+        return self.array[:len(self)]
+
+    def index(self, item: T) -> int:
+        """
+        :complexity: O(n), vectorized
+        """
+        matches = np.flatnonzero(self.as_numpy() == item)
+        if len(matches) == 0:
+            raise KeyError("Item not found")
+        return int(matches[0])
+
+    def count(self, item: T) -> int:
+        """
+        Number of occurrences of item
+        :complexity: O(n), vectorized
+        """
+        return int(np.count_nonzero(self.as_numpy() == item))
+
+    def __contains__(self, item: T) -> bool:
+        return bool((self.as_numpy() == item).any())
+
+    def __iter__(self):
+        """
+        Yields the items as Python scalars, converting a chunk at a time
+        """
+        for start in range(0, len(self), NumpyArrayList.ITER_CHUNK):
+            yield from self.array[start:min(start + NumpyArrayList.ITER_CHUNK, len(self))].tolist()
+
+    def min(self) -> T:
+        if self.is_empty():
+            raise ValueError("List is empty")
+        return self.as_numpy().min().item()
+
+    def max(self) -> T:
+        if self.is_empty():
+            raise ValueError("List is empty")
+        return self.as_numpy().max().item()
+
+    def sum(self) -> T:
+        return self.as_numpy().sum().item()
+
+    def filter(self, predicate) -> "NumpyArrayList[T]":
+        """
+        Returns a new list of the items for which the predicate holds.
+        The predicate is called once with the numpy view of the items
+        and must return a boolean mask, e.g. lambda a: a % 2 == 0
+        :complexity: O(n), vectorized
+        """
+        items = self.as_numpy()[predicate(self.as_numpy())]
+        result = NumpyArrayList(len(items), self.dtype)
+        result.extend(items)
+        return result
 
 
 class SortedArrayList(SortedList):
@@ -301,45 +667,318 @@ class SortedArrayList(SortedList):
         return self.array[index]
 
     def index(self, item: T) -> int:
+        """
+        :complexity: O(log n)
+        """
+        index = self.bisect_left(item)
+        if index < len(self) and self.array[index] == item:
+            return index
+        raise KeyError("Item not found")
+
+    def bisect_left(self, item: T) -> int:
+        """
+        Index at which item would be inserted before any equal items
+        :complexity: O(log n)
+        """
         low = 0
-        high = len(self) - 1
-        while low <= high:
+        high = len(self)
+        while low < high:
             mid = (low + high) // 2
-            if self.array[mid] == item:
-                return mid
-            elif self.array[mid] > item:
-                high = mid - 1
-            elif self.array[mid] < item:
+            if self.array[mid] < item:
                 low = mid + 1
-        raise KeyError("Item not found")
+            else:
+                high = mid
+        return low
+
+    def bisect_right(self, item: T) -> int:
+        """
+        Index at which item would be inserted after any equal items
+        :complexity: O(log n)
+        """
+        low = 0
+        high = len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if item < self.array[mid]:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def irange(self, low: T, high: T):
+        """
+        Lazily yields the items in the range low <= item <= high
+        :complexity: O(log n) to locate the range, O(1) per item yielded
+        """
+        start = self.bisect_left(low)
+        stop = self.bisect_right(high)
+        for i in range(start, stop):
+            yield self.array[i]
 
     def delete_at_index(self, index: int) -> None:
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i+1]
+        """
+        :complexity: O(n)
+        """
+        if index >= len(self):
+            raise IndexError("Index is out of bounds")
+        self.array[index:len(self) - 1] = self.array[index + 1:len(self)]
         self.length -= 1
+        self.array[len(self)] = None
 
     def add(self, item: T) -> None:
+        """
+        Binary search for the position, then shift the tail once
+        :complexity: O(log n) comparisons, O(n) move
+        """
         if len(self) == len(self.array):
             self._resize()
-
-        self.array[len(self)] = item
-        for i in range(len(self) - 1, -1, -1):
-            if item < self.array[i]:
-                self.array[i], self.array[i + 1] = self.array[i + 1], self.array[i]
+        index = self.bisect_right(item)
+        self.array[index + 1:len(self) + 1] = self.array[index:len(self)]
+        self.array[index] = item
         self.length += 1
 
+    def add_many(self, items) -> None:
+        """
+        Sorts the batch and merges it in with a single pass from the back,
+        so each existing item is moved at most once
+        :complexity: O(k log k + n) where k is the number of items
+        """
+        items = sorted(items)
+        if len(self) + len(items) > len(self.array):
+            factor = 2
+            while max(len(self.array), 1) * factor < len(self) + len(items):
+                factor *= 2
+            self._resize(factor)
+
+        i = len(self) - 1
+        j = len(items) - 1
+        for k in range(len(self) + len(items) - 1, -1, -1):
+            if j < 0:
+                break
+            if i >= 0 and items[j] < self.array[i]:
+                self.array[k] = self.array[i]
+                i -= 1
+            else:
+                self.array[k] = items[j]
+                j -= 1
+        self.length += len(items)
+
     def _resize(self, factor: int = 2):
-        array = [None] * len(self.array) * factor
-        for i in range(len(self)):
-            array[i] = self.array[i]
+        array = [None] * (max(len(self.array), 1) * factor)
+        array[:len(self)] = self.array[:len(self)]
         self.array = array
 
-    def __str__(self):
-        return_string = "["
-        for i in range(len(self)):
-            return_string += str(self.array[i]) + ", "
-        return_string += "]"
-        return return_string
+    def __iter__(self):
+        return islice(self.array, len(self))
+
+    def __reduce_ex__(self, protocol: int):
+        return type(self), (0,), self.array[:len(self)]
+
+    def __setstate__(self, items: list) -> None:
+        self.array = items
+        self.length = len(items)
+
+
+class ArrayHeap(PriorityQueue[T]):
+    """
+    Min heap implementation with array, where every node has arity children.
+    A higher arity gives a shallower heap whose children sit in adjacent
+    slots, trading more comparisons per level for fewer levels.
+    Positions of items are kept in a dict, so the priority of an item
+    can be changed in O(log n). Items must be hashable and unique.
+    Uses resizing
+    """
+    DEFAULT_SIZE = 6
+    DEFAULT_ARITY = 2
+
+    def __init__(self, size: int = DEFAULT_SIZE, arity: int = DEFAULT_ARITY):
+        """
+        :param size: Initial capacity
+        :param arity: Number of children of each node
+        :complexity: O(n) where n is the size
+        """
+        PriorityQueue.__init__(self)
+        if arity < 2:
+            raise ValueError("Arity must be at least 2")
+        self.arity = arity
+        self.array = [None] * size
+        self.positions = {}
+
+    def push(self, item: T, priority) -> None:
+        """
+        :complexity: O(log n)
+        with resize O(n) where n is the size of the larger array
+        """
+        if item in self.positions:
+            raise ValueError("Item is already in the queue. Use update instead")
+        if len(self) == len(self.array):
+            self._resize()
+        self.length += 1
+        self._sift_up(len(self) - 1, (priority, item))
+
+    def pop(self) -> T:
+        """
+        :complexity: O(log n)
+        """
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        item = self.array[0][1]
+        del self.positions[item]
+        self.length -= 1
+        last = self.array[len(self)]
+        self.array[len(self)] = None
+        if not self.is_empty():
+            self._sift_down(0, last)
+        return item
+
+    def peek(self) -> T:
+        """
+        :complexity: O(1)
+        """
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        return self.array[0][1]
+
+    def priority(self, item: T):
+        """
+        Current priority of an item in the queue
+        :complexity: O(1)
+        """
+        return self.array[self._position(item)][0]
+
+    def update(self, item: T, priority) -> None:
+        """
+        Changes the priority of an item, in either direction
+        :complexity: O(log n)
+        """
+        index = self._position(item)
+        if priority < self.array[index][0]:
+            self._sift_up(index, (priority, item))
+        else:
+            self._sift_down(index, (priority, item))
+
+    def decrease_key(self, item: T, priority) -> None:
+        """
+        Lowers the priority of an item
+        :complexity: O(log n)
+        """
+        index = self._position(item)
+        if self.array[index][0] < priority:
+            raise ValueError("New priority is larger than the current priority")
+        self._sift_up(index, (priority, item))
+
+    def push_many(self, entries) -> None:
+        """
+        Pushes every (item, priority) pair. A batch at least as large as
+        the heap is merged in with heapify, in O(n + k), rather than
+        sifted up one at a time
+        :complexity: O(min(k log(n + k), n + k)) where k is the number of pairs
+        """
+        entries = list(entries)
+        if len(entries) < len(self):
+            PriorityQueue.push_many(self, entries)
+            return
+        self.heapify(chain(((entry[1], entry[0]) for entry in islice(self.array, len(self))), entries))
+
+    def heapify(self, entries) -> None:
+        """
+        Replaces the contents of the queue with (item, priority) pairs,
+        sifting down from the last parent to the root
+        :complexity: O(n)
+        """
+        array = [(priority, item) for item, priority in entries]
+        positions = {entry[1]: i for i, entry in enumerate(array)}
+        if len(positions) != len(array):
+            raise ValueError("Items must be unique")
+        self.array = array
+        self.positions = positions
+        self.length = len(array)
+        for i in range((len(self) - 2) // self.arity, -1, -1):
+            self._sift_down(i, self.array[i])
+
+    def _position(self, item: T) -> int:
+        try:
+            return self.positions[item]
+        except KeyError:
+            raise KeyError("Item not found")
+
+    def _sift_up(self, index: int, entry) -> None:
+        """
+        Moves parents down into the hole at index until entry fits,
+        so each level costs one write instead of a swap
+        """
+        array = self.array
+        positions = self.positions
+        priority = entry[0]
+        while index > 0:
+            parent = (index - 1) // self.arity
+            parent_entry = array[parent]
+            if not priority < parent_entry[0]:
+                break
+            array[index] = parent_entry
+            positions[parent_entry[1]] = index
+            index = parent
+        array[index] = entry
+        positions[entry[1]] = index
+
+    def _sift_down(self, index: int, entry) -> None:
+        """
+        Moves the smallest child up into the hole at index until entry fits
+        """
+        array = self.array
+        positions = self.positions
+        arity = self.arity
+        length = len(self)
+        priority = entry[0]
+        while True:
+            first = index * arity + 1
+            if first >= length:
+                break
+            smallest = first
+            smallest_priority = array[first][0]
+            for child in range(first + 1, min(first + arity, length)):
+                if array[child][0] < smallest_priority:
+                    smallest = child
+                    smallest_priority = array[child][0]
+            if not smallest_priority < priority:
+                break
+            array[index] = array[smallest]
+            positions[array[index][1]] = index
+            index = smallest
+        array[index] = entry
+        positions[entry[1]] = index
+
+    def _resize(self, factor: int = 2) -> None:
+        """
+        :complexity: O(n)
+        """
+        array = [None] * (max(len(self.array), 1) * factor)
+        array[:len(self)] = self.array[:len(self)]
+        self.array = array
+
+    def __contains__(self, item: T) -> bool:
+        return item in self.positions
+
+    def __iter__(self):
+        """
+        Yields the items in heap order, not in order of priority
+        """
+        return (entry[1] for entry in islice(self.array, len(self)))
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Entries are pickled in heap order, so heapify does no swaps on load.
+        The positions are rebuilt rather than pickled
+        """
+        return type(self), (0, self.arity), [(item, priority) for priority, item in islice(self.array, len(self))]
+
+    def __setstate__(self, entries: list) -> None:
+        self.heapify(entries)
+
+    def clear(self) -> None:
+        PriorityQueue.clear(self)
+        self.array = [None] * len(self.array)
+        self.positions = {}
 
 
 if __name__ == "__main__":
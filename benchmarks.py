@@ -0,0 +1,761 @@
+"""
+Benchmarks for the ADT implementations.
+Running this module runs the suite over every implementation, writes the
+results as JSON, and fails if ops/sec regressed against a stored baseline:
+    python benchmarks.py --baseline bench_baseline.json
+The bench_ functions are one-off comparisons, run individually
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+import argparse
+import functools
+import heapq
+import json
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from array_implementations import ArrayStack, LinearQueue, CircularQueue, ArrayList, NumpyArrayList, \
+    SortedArrayList, ArrayHeap, np
+from cache import Cache
+from chunked_implementations import ChunkedSortedList
+from hashtable import HashTable
+from linked_implmentations import LinkedList
+from persistent_implementations import PersistentVector, PersistentQueue
+from trie import Trie
+import serialization
+import sorts
+
+
+def timed(function, *args):
+    """
+    Calls function with args and returns (result, seconds taken)
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_numpy_array_list(size: int = 10_000_000, seed: int = 0) -> None:
+    """
+    Compares ArrayList against NumpyArrayList on int64 items:
+    bulk build, index, membership, sum and filtering, plus memory per item
+    """
+    rng = random.Random(seed)
+    items = [rng.randrange(2 ** 40) for _ in range(size)]
+    missing = -1
+
+    plain, plain_build = timed(lambda: _build(ArrayList(size), items))
+    typed, typed_build = timed(lambda: _build(NumpyArrayList(size), items))
+
+    plain_bytes = sys.getsizeof(plain.array) + sum(sys.getsizeof(item) for item in items)
+    typed_bytes = typed.array.nbytes
+
+    rows = [
+        ("build", plain_build, typed_build),
+        ("index (miss)", timed(_index_or_none, plain, missing)[1], timed(_index_or_none, typed, missing)[1]),
+        ("contains (miss)", timed(_contains, plain, missing)[1], timed(typed.__contains__, missing)[1]),
+        ("sum", timed(_sum, plain)[1], timed(typed.sum)[1]),
+        ("filter even", timed(_filter_even, plain)[1], timed(typed.filter, lambda a: a % 2 == 0)[1]),
+    ]
+    print("NumpyArrayList vs ArrayList, {} int64 items".format(size))
+    print("{:<16}{:>12}{:>12}{:>10}".format("operation", "ArrayList", "Numpy", "speedup"))
+    for name, plain_time, typed_time in rows:
+        print("{:<16}{:>11.3f}s{:>11.3f}s{:>9.1f}x".format(name, plain_time, typed_time, plain_time / typed_time))
+    print("bytes per item: {:.1f} vs {:.1f}".format(plain_bytes / size, typed_bytes / size))
+
+
+def _build(array_list, items):
+    array_list.extend(items)
+    return array_list
+
+
+def _index_or_none(array_list, item):
+    try:
+        return array_list.index(item)
+    except KeyError:
+        return None
+
+
+def _contains(array_list, item):
+    return _index_or_none(array_list, item) is not None
+
+
+def _sum(array_list):
+    total = 0
+    for i in range(len(array_list)):
+        total += array_list[i]
+    return total
+
+
+def _filter_even(array_list):
+    result = ArrayList()
+    for i in range(len(array_list)):
+        if array_list[i] % 2 == 0:
+            result.append(array_list[i])
+    return result
+
+
+def bench_sorted_list_scaling(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7),
+                              flat_limit: int = 10 ** 6, seed: int = 0) -> None:
+    """
+    Random adds, rank lookups and removes against SortedArrayList and
+    ChunkedSortedList. The flat list is quadratic to build one item at a
+    time, so it is skipped for sizes above flat_limit
+    """
+    print("{:>10}{:>12}{:>14}{:>14}{:>14}".format("size", "list", "add/s", "getitem/s", "remove/s"))
+    for size in sizes:
+        rng = random.Random(seed)
+        items = [rng.random() for _ in range(size)]
+        positions = [rng.randrange(size) for _ in range(min(size, 10 ** 5))]
+        removals = items[:min(size, 10 ** 5)]
+        for name, make in (("flat", lambda: SortedArrayList(size)), ("chunked", ChunkedSortedList)):
+            if name == "flat" and size > flat_limit:
+                print("{:>10}{:>12}{:>14}".format(size, name, "skipped"))
+                continue
+            sorted_list = make()
+            _, add_time = timed(_add_all, sorted_list, items)
+            _, get_time = timed(_get_all, sorted_list, positions)
+            _, remove_time = timed(_remove_all, sorted_list, removals)
+            print("{:>10}{:>12}{:>14.0f}{:>14.0f}{:>14.0f}".format(
+                size, name, size / add_time, len(positions) / get_time, len(removals) / remove_time))
+
+
+def _add_all(sorted_list, items):
+    for item in items:
+        sorted_list.add(item)
+
+
+def _get_all(sorted_list, positions):
+    for position in positions:
+        sorted_list[position]
+
+
+def _remove_all(sorted_list, items):
+    for item in items:
+        sorted_list.remove(item)
+
+
+def bench_dijkstra(vertices: int = 100_000, degree: int = 8, seed: int = 0) -> None:
+    """
+    Single source shortest paths on a random directed graph, using heapq
+    with lazy deletion against ArrayHeap with decrease_key at arity 2, 4 and 8
+    """
+    rng = random.Random(seed)
+    graph = [[(rng.randrange(vertices), rng.random()) for _ in range(degree)] for _ in range(vertices)]
+
+    expected, heapq_time = timed(_dijkstra_heapq, graph)
+    print("Dijkstra, {} vertices, {} edges".format(vertices, vertices * degree))
+    print("{:<12}{:>10.3f}s".format("heapq", heapq_time))
+    for arity in (2, 4, 8):
+        distances, heap_time = timed(_dijkstra_array_heap, graph, arity)
+        assert distances == expected
+        print("{:<12}{:>10.3f}s".format("d={}".format(arity), heap_time))
+
+
+def _dijkstra_heapq(graph):
+    distances = [float("inf")] * len(graph)
+    distances[0] = 0.0
+    heap = [(0.0, 0)]
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if distance > distances[vertex]:
+            continue
+        for target, weight in graph[vertex]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                distances[target] = candidate
+                heapq.heappush(heap, (candidate, target))
+    return distances
+
+
+def _dijkstra_array_heap(graph, arity):
+    distances = [float("inf")] * len(graph)
+    distances[0] = 0.0
+    heap = ArrayHeap(len(graph), arity)
+    heap.push(0, 0.0)
+    while not heap.is_empty():
+        vertex = heap.pop()
+        distance = distances[vertex]
+        for target, weight in graph[vertex]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                if target in heap:
+                    heap.decrease_key(target, candidate)
+                else:
+                    heap.push(target, candidate)
+                distances[target] = candidate
+    return distances
+
+
+def bench_sorts(size: int = 1_000_000, seed: int = 0) -> None:
+    """
+    sorts.sort on an ArrayList, stable and adaptive, against copying the
+    items out to a Python list, calling list.sort and copying them back
+    """
+    rng = random.Random(seed)
+    inputs = {
+        "random": [rng.random() for _ in range(size)],
+        "sorted": [float(i) for i in range(size)],
+        "reversed": [float(i) for i in range(size, 0, -1)],
+        "few unique": [float(rng.randrange(8)) for _ in range(size)],
+    }
+    print("Sorting an ArrayList of {} floats".format(size))
+    print("{:<12}{:>12}{:>12}{:>12}{:>12}".format("input", "adaptive", "stable", "key", "list.sort"))
+    for name, items in inputs.items():
+        times = []
+        for options in ({}, {"stable": True}, {"key": abs}):
+            array_list = _build(ArrayList(size), items)
+            times.append(timed(lambda: sorts.sort(array_list, **options))[1])
+        array_list = _build(ArrayList(size), items)
+        times.append(timed(_copy_sort, array_list)[1])
+        print("{:<12}".format(name) + "".join("{:>11.3f}s".format(t) for t in times))
+
+
+def _copy_sort(array_list):
+    items = array_list.array[:len(array_list)]
+    items.sort()
+    array_list.array[:len(array_list)] = items
+
+
+def bench_external_sort(size_bytes: int = 4 * 1024 ** 3, run_size: int = 4_000_000,
+                        workers=(1, os.cpu_count()), temp_dir: str = None) -> None:
+    """
+    Writes a synthetic file of random int64 records and streams it through
+    sorts.external_sort with each worker count, checking the output order
+    """
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        path = os.path.join(directory, "records.bin")
+        with open(path, "wb") as file:
+            remaining = size_bytes - size_bytes % 8
+            while remaining:
+                block = min(remaining, 64 * 1024 ** 2)
+                file.write(os.urandom(block))
+                remaining -= block
+        records = size_bytes // 8
+        print("External sort of {} int64 records ({:.1f} GB)".format(records, size_bytes / 1024 ** 3))
+        for count in workers:
+            _, seconds = timed(_check_sorted, sorts.external_sort(path, run_size, "q", workers=count, temp_dir=directory))
+            print("{:>3} workers{:>10.1f}s{:>10.1f} MB/s".format(count, seconds, size_bytes / 1024 ** 2 / seconds))
+
+
+def _check_sorted(records):
+    previous = None
+    count = 0
+    for record in records:
+        assert previous is None or previous <= record
+        previous = record
+        count += 1
+    return count
+
+
+def bench_cache(trace_length: int = 1_000_000, universe: int = 100_000,
+                capacities=(1_000, 10_000), seed: int = 0) -> None:
+    """
+    Hit rate and lookups per second of the LRU and LFU Cache against
+    functools.lru_cache, replaying a Zipfian trace of keys
+    """
+    trace = zipfian_keys(universe, trace_length, random.Random(seed))
+    print("Zipfian trace of {} lookups over {} keys".format(trace_length, universe))
+    print("{:>10}{:>14}{:>10}{:>14}".format("capacity", "cache", "hit rate", "lookups/s"))
+    for capacity in capacities:
+        for policy in (Cache.LRU, Cache.LFU):
+            cache = Cache(capacity, policy)
+            _, seconds = timed(_replay, cache, trace)
+            print("{:>10}{:>14}{:>10.3f}{:>14.0f}".format(
+                capacity, policy, cache.stats.hit_rate(), trace_length / seconds))
+        cached = functools.lru_cache(capacity)(lambda key: key)
+        _, seconds = timed(lambda: [cached(key) for key in trace])
+        info = cached.cache_info()
+        print("{:>10}{:>14}{:>10.3f}{:>14.0f}".format(
+            capacity, "lru_cache", info.hits / trace_length, trace_length / seconds))
+
+
+def _replay(cache, trace):
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)
+
+
+def bench_snapshots(size: int = 100_000, updates: int = 10_000, seed: int = 0) -> None:
+    """
+    Snapshot heavy workloads: after every update a snapshot of the whole
+    container is kept. Copying an ArrayList or LinearQueue per snapshot
+    against keeping each version of a PersistentVector or PersistentQueue
+    """
+    rng = random.Random(seed)
+    positions = [rng.randrange(size) for _ in range(updates)]
+    print("{} updates with a snapshot after each, on {} items".format(updates, size))
+
+    array_list = _build(ArrayList(size), range(size))
+    _, copy_time = timed(_snapshot_copies, array_list, positions)
+    vector = PersistentVector(range(size))
+    _, persistent_time = timed(_snapshot_versions, vector, positions)
+    print("{:<28}{:>10.3f}s".format("ArrayList + copy", copy_time))
+    print("{:<28}{:>10.3f}s".format("PersistentVector.set", persistent_time))
+
+    queue = LinearQueue(size)
+    for item in range(size):
+        queue.append(item)
+    _, copy_time = timed(_queue_snapshot_copies, queue, updates)
+    _, persistent_time = timed(_queue_snapshot_versions, PersistentQueue(range(size)), updates)
+    print("{:<28}{:>10.3f}s".format("LinearQueue + copy", copy_time))
+    print("{:<28}{:>10.3f}s".format("PersistentQueue", persistent_time))
+
+
+def _snapshot_copies(array_list, positions):
+    snapshots = []
+    for position in positions:
+        array_list[position] = -position
+        snapshots.append(array_list[0:len(array_list)])
+    return snapshots
+
+
+def _snapshot_versions(vector, positions):
+    snapshots = []
+    for position in positions:
+        vector = vector.set(position, -position)
+        snapshots.append(vector)
+    return snapshots
+
+
+def _queue_snapshot_copies(queue, updates):
+    snapshots = []
+    for item in range(updates):
+        queue.append(queue.serve())
+        snapshot = LinearQueue(len(queue))
+        for i in range(queue.front, queue.rear):
+            snapshot.append(queue.array[i])
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def _queue_snapshot_versions(queue, updates):
+    snapshots = []
+    for item in range(updates):
+        item, queue = queue.serve()
+        queue = queue.append(item)
+        snapshots.append(queue)
+    return snapshots
+
+
+def bench_serialization(size: int = 1_000_000) -> None:
+    """
+    Serialized size and round trip time of each container, pickled with
+    protocol 5 and streamed through serialization.dump and load.
+    The default column is the size of pickling the instance attributes,
+    as pickle did before the containers defined __reduce_ex__
+    """
+    print("Serialization of {} items per container".format(size))
+    print("{:<22}{:>14}{:>14}{:>14}{:>12}{:>12}".format(
+        "container", "default", "protocol 5", "dump", "pickle", "dump/load"))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "checkpoint.bin")
+        for name, container in _serialization_containers(size):
+            try:
+                default = len(pickle.dumps(container.__dict__, protocol=5))
+            except RecursionError:
+                default = "-"
+            data, pickle_time = timed(_pickle_round_trip, container)
+            written, dump_time = timed(_dump_round_trip, container, path)
+            print("{:<22}{:>14}{:>14}{:>14}{:>11.3f}s{:>11.3f}s".format(
+                name, default, len(data), written, pickle_time, dump_time))
+
+
+def _serialization_containers(size: int):
+    typed = ArrayList(size, "q")
+    typed.extend(range(size))
+    numpy_list = NumpyArrayList(size) if np is not None else None
+    if numpy_list is not None:
+        numpy_list.extend(range(size))
+    linear = LinearQueue(size)
+    linear.extend(range(size))
+    linear.serve_many(size // 2)
+    circular = CircularQueue(size)
+    circular.extend(range(size))
+    circular.serve_many(size // 2)
+    circular.extend(range(size // 4))
+    hashtable = HashTable()
+    _fill_hashtable(hashtable, size)
+    trie = Trie()
+    _fill_trie(trie, size)
+    linked = LinkedList()
+    linked.extend(range(size))
+    containers = [
+        ("ArrayList", _build(ArrayList(size), range(size))),
+        ("ArrayList q", typed),
+        ("NumpyArrayList", numpy_list),
+        ("LinearQueue", linear),
+        ("CircularQueue", circular),
+        ("HashTable", hashtable),
+        ("Trie", trie),
+        ("LinkedList", linked),
+    ]
+    return [(name, container) for name, container in containers if container is not None]
+
+
+def _pickle_round_trip(container):
+    data = pickle.dumps(container, protocol=5)
+    pickle.loads(data)
+    return data
+
+
+def _dump_round_trip(container, path):
+    with open(path, "wb") as file:
+        written = serialization.dump(container, file)
+    with open(path, "rb") as file:
+        serialization.load(file)
+    return written
+
+
+# Benchmark suite
+# ==================================================================
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+PATTERNS = ("sequential", "random", "zipfian")
+OPS_LIMIT = 100_000
+LINEAR_BUDGET = 10 ** 7
+DEFAULT_SEED = 0
+DEFAULT_THRESHOLD = 0.25
+
+
+def sequential_keys(size: int, count: int, rng: random.Random) -> list:
+    return [i % size for i in range(count)]
+
+
+def random_keys(size: int, count: int, rng: random.Random) -> list:
+    return [rng.randrange(size) for _ in range(count)]
+
+
+def zipfian_keys(size: int, count: int, rng: random.Random) -> list:
+    """
+    Keys with a Zipf (s = 1) distribution over ranks, where rank k maps to
+    index k - 1. Uses the inverse of the continuous CDF, floor(size ** u),
+    so no table of weights is needed
+    """
+    return [int(size ** rng.random()) - 1 for _ in range(count)]
+
+
+KEY_PATTERNS = {"sequential": sequential_keys, "random": random_keys, "zipfian": zipfian_keys}
+
+
+class Workload:
+    """
+    One operation on one implementation of an ADT.
+    make(size) creates the container, fill(container, size) loads it
+    before timing, and run(container, keys) performs one operation per key.
+    linear marks operations that cost O(n) each, which are run fewer times
+    on large containers to keep the total work bounded
+    """
+    def __init__(self, adt: str, implementation: str, operation: str, make, run, fill=None,
+                 patterns=("sequential",), max_size: int = SIZES[-1], linear: bool = False) -> None:
+        self.adt = adt
+        self.implementation = implementation
+        self.operation = operation
+        self.make = make
+        self.fill = fill
+        self.run = run
+        self.patterns = patterns
+        self.max_size = max_size
+        self.linear = linear
+
+    def name(self, pattern: str) -> str:
+        return "/".join((self.adt, self.implementation, self.operation, pattern))
+
+    def count(self, size: int) -> int:
+        """
+        Number of operations timed at a given size
+        """
+        if self.fill is None:
+            return size
+        if self.linear:
+            return max(10, min(size, LINEAR_BUDGET // size))
+        return min(size, OPS_LIMIT)
+
+    def measure(self, size: int, pattern: str, seed: int, repeat: int) -> dict:
+        """
+        Best of repeat timings, each on a freshly built container
+        """
+        rng = random.Random("{}/{}/{}".format(self.name(pattern), size, seed))
+        count = self.count(size)
+        keys = KEY_PATTERNS[pattern](size, count, rng)
+        best = float("inf")
+        for _ in range(repeat):
+            container = self.make(size)
+            if self.fill is not None:
+                self.fill(container, size)
+            _, seconds = timed(self.run, container, keys)
+            best = min(best, seconds)
+        return {
+            "name": self.name(pattern), "adt": self.adt, "implementation": self.implementation,
+            "operation": self.operation, "pattern": pattern, "size": size, "ops": count,
+            "seconds": best, "ops_per_sec": count / best if best else float("inf"),
+        }
+
+
+def _word(number: int) -> str:
+    """
+    Lowercase word spelling out number in base 26, for Trie keys
+    """
+    letters = []
+    while True:
+        number, digit = divmod(number, 26)
+        letters.append(chr(97 + digit))
+        if number == 0:
+            return "".join(letters)
+
+
+def _push_all(stack, keys):
+    for key in keys:
+        stack.push(key)
+
+
+def _pop_all(stack, keys):
+    for _ in keys:
+        stack.pop()
+
+
+def _fill_stack(stack, size):
+    for i in range(size):
+        stack.push(i)
+
+
+def _append_all(container, keys):
+    for key in keys:
+        container.append(key)
+
+
+def _serve_all(queue, keys):
+    for _ in keys:
+        queue.serve()
+
+
+def _fill_append(container, size):
+    for i in range(size):
+        container.append(i)
+
+
+def _set_all(container, keys):
+    for key in keys:
+        container[key] = key
+
+
+def _insert_all(array_list, keys):
+    for key in keys:
+        array_list.insert(key, key)
+
+
+def _linked_insert_all(linked_list, keys):
+    for key in keys:
+        linked_list.insert(key, key)
+
+
+def _fill_linked(linked_list, size):
+    for i in range(size - 1, -1, -1):
+        linked_list.insert(i, 0)
+
+
+def _index_all(container, keys):
+    for key in keys:
+        container.index(key)
+
+
+def _fill_sorted(sorted_list, size):
+    sorted_list.add_many(range(size))
+
+
+def _push_priorities(heap, keys):
+    for i, key in enumerate(keys):
+        heap.push(i, key)
+
+
+def _fill_heap(heap, size):
+    heap.heapify((i, (i * 7919) % size) for i in range(size))
+
+
+def _pop_heap(heap, keys):
+    for _ in keys:
+        heap.pop()
+
+
+def _hashtable_insert_all(hashtable, keys):
+    for key in keys:
+        hashtable.insert((key, key))
+
+
+def _fill_hashtable(hashtable, size):
+    for i in range(size):
+        hashtable.insert((i, i))
+
+
+def _make_trie(size):
+    return Trie([])
+
+
+def _trie_insert_all(trie, keys):
+    for key in keys:
+        trie.insert(_word(key))
+
+
+def _fill_trie(trie, size):
+    for i in range(size):
+        trie.insert(_word(i))
+
+
+def _trie_search_all(trie, keys):
+    for key in keys:
+        trie.search(_word(key))
+
+
+def workloads() -> list:
+    """
+    Every workload of the suite
+    """
+    suite = [
+        Workload("Stack", "ArrayStack", "push", ArrayStack, _push_all),
+        Workload("Stack", "ArrayStack", "pop", ArrayStack, _pop_all, _fill_stack),
+    ]
+    for name, queue in (("LinearQueue", LinearQueue), ("CircularQueue", CircularQueue)):
+        suite += [
+            Workload("Queue", name, "append", lambda size, queue=queue: queue(), _append_all),
+            Workload("Queue", name, "serve", lambda size, queue=queue: queue(), _serve_all, _fill_append),
+        ]
+
+    lists = [("ArrayList", ArrayList)]
+    if np is not None:
+        lists.append(("NumpyArrayList", NumpyArrayList))
+    for name, array_list in lists:
+        suite += [
+            Workload("List", name, "append", lambda size, array_list=array_list: array_list(), _append_all),
+            Workload("List", name, "getitem", array_list, _get_all, _fill_append, PATTERNS),
+            Workload("List", name, "setitem", array_list, _set_all, _fill_append, PATTERNS),
+            Workload("List", name, "insert", array_list, _insert_all, _fill_append, PATTERNS, linear=True),
+            Workload("List", name, "index", array_list, _index_all, _fill_append, PATTERNS, linear=True),
+        ]
+    suite += [
+        Workload("List", "LinkedList", "insert", lambda size: LinkedList(), _linked_insert_all, _fill_linked,
+                 PATTERNS, max_size=10 ** 5, linear=True),
+        Workload("List", "LinkedList", "getitem", lambda size: LinkedList(), _get_all, _fill_linked,
+                 PATTERNS, max_size=10 ** 5, linear=True),
+        Workload("List", "LinkedList", "index", lambda size: LinkedList(), _index_all, _fill_linked,
+                 PATTERNS, max_size=10 ** 5, linear=True),
+    ]
+
+    suite += [
+        Workload("SortedList", "SortedArrayList", "add", SortedArrayList, _add_all, _fill_sorted,
+                 PATTERNS, linear=True),
+        Workload("SortedList", "ChunkedSortedList", "add", lambda size: ChunkedSortedList(), _add_all,
+                 _fill_sorted, PATTERNS),
+    ]
+    for name, sorted_list in (("SortedArrayList", SortedArrayList), ("ChunkedSortedList", None)):
+        make = sorted_list or (lambda size: ChunkedSortedList())
+        suite += [
+            Workload("SortedList", name, "getitem", make, _get_all, _fill_sorted, PATTERNS),
+            Workload("SortedList", name, "index", make, _index_all, _fill_sorted, PATTERNS),
+        ]
+
+    for arity in (2, 4):
+        name = "ArrayHeap(d={})".format(arity)
+        make = lambda size, arity=arity: ArrayHeap(size, arity)
+        suite += [
+            Workload("PriorityQueue", name, "push", make, _push_priorities, patterns=("random",)),
+            Workload("PriorityQueue", name, "pop", make, _pop_heap, _fill_heap),
+        ]
+
+    suite += [
+        Workload("HashTable", "HashTable", "insert", lambda size: HashTable(2 * size + 1, size + 1),
+                 _hashtable_insert_all),
+        Workload("HashTable", "HashTable", "getitem", lambda size: HashTable(2 * size + 1, size + 1),
+                 _get_all, _fill_hashtable, PATTERNS),
+        Workload("Trie", "Trie", "insert", _make_trie, _trie_insert_all, max_size=10 ** 6),
+        Workload("Trie", "Trie", "search", _make_trie, _trie_search_all, _fill_trie, PATTERNS, max_size=10 ** 6),
+    ]
+    return suite
+
+
+def run_suite(sizes=SIZES, patterns=PATTERNS, only=None, seed: int = DEFAULT_SEED, repeat: int = 3) -> dict:
+    """
+    Runs every workload at every size up to its max_size
+    :param only: Names of ADTs or implementations to run, or None for all
+    :return: Results, with a scaling curve of ops/sec against size per workload
+    """
+    results = []
+    for workload in workloads():
+        if only and workload.adt not in only and workload.implementation not in only:
+            continue
+        for pattern in workload.patterns:
+            if pattern not in patterns:
+                continue
+            for size in sizes:
+                if size > workload.max_size:
+                    continue
+                result = workload.measure(size, pattern, seed, repeat)
+                print("{:<48}{:>10}{:>14.0f} ops/s".format(result["name"], size, result["ops_per_sec"]))
+                results.append(result)
+
+    curves = {}
+    for result in results:
+        curves.setdefault(result["name"], []).append([result["size"], result["ops_per_sec"]])
+    return {
+        "meta": {"seed": seed, "repeat": repeat, "sizes": list(sizes), "python": sys.version.split()[0]},
+        "results": results,
+        "curves": curves,
+    }
+
+
+def regressions(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Workloads whose ops/sec fell by more than threshold against the baseline.
+    Workloads missing from either side are ignored
+    :return: List of (name, size, baseline ops/sec, ops/sec)
+    """
+    expected = {(result["name"], result["size"]): result["ops_per_sec"] for result in baseline["results"]}
+    slower = []
+    for result in results["results"]:
+        before = expected.get((result["name"], result["size"]))
+        if before is not None and result["ops_per_sec"] < before * (1 - threshold):
+            slower.append((result["name"], result["size"], before, result["ops_per_sec"]))
+    return slower
+
+
+def main(argv=None) -> int:
+    """
+    Runs the suite, writes the results as JSON and compares them against
+    a stored baseline. Returns 1 if any workload regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--patterns", nargs="+", choices=PATTERNS, default=PATTERNS)
+    parser.add_argument("--only", nargs="+", help="ADT or implementation names to run")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed fractional drop in ops/sec")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results to the baseline file instead of comparing")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.patterns, args.only, args.seed, args.repeat)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    slower = regressions(results, baseline, args.threshold)
+    for name, size, before, after in slower:
+        print("REGRESSION {} at {}: {:.0f} -> {:.0f} ops/s".format(name, size, before, after))
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
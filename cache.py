@@ -0,0 +1,272 @@
+"""
+Bounded memoization cache.
+Keys map to entry nodes through a HashTable, and the entries are ordered
+for eviction in intrusive doubly linked lists, so every operation is O(1)
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+import functools
+import sys
+import time
+from hashtable import HashTable
+from linked_implmentations import DoubleNode, DoublyLinkedList
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+def sizeof_weigher(key, item) -> int:
+    """
+    Weighs an entry by the shallow size of its item in bytes
+    """
+    return sys.getsizeof(item)
+
+
+class _Entry(DoubleNode):
+    def __init__(self, key, item, weight: int, expires: float) -> None:
+        DoubleNode.__init__(self, item)
+        self.key = key
+        self.weight = weight
+        self.expires = expires
+        self.bucket = None
+
+
+class _FrequencyBucket(DoubleNode):
+    """
+    Entries that have been used the same number of times,
+    most recently used at the front
+    """
+    def __init__(self, frequency: int) -> None:
+        DoubleNode.__init__(self)
+        self.frequency = frequency
+        self.entries = DoublyLinkedList()
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return "hits: {}, misses: {}, evictions: {}, expirations: {}, hit rate: {:.3f}".format(
+            self.hits, self.misses, self.evictions, self.expirations, self.hit_rate())
+
+
+class Cache:
+    """
+    Cache holding entries up to a total weight of capacity.
+    With the lru policy, the least recently used entry is evicted first.
+    With the lfu policy, the least frequently used entry is evicted first,
+    the least recently used among equals. Frequencies are kept as a list
+    of buckets in increasing order, so a use moves an entry to the next
+    bucket in O(1).
+    Entries weigh 1 unless a weigher is given, e.g. sizeof_weigher to
+    bound the cache in bytes. Entries older than ttl seconds are dropped
+    when they are next looked up.
+    on_evict(key, item) is called for every entry evicted or expired
+    """
+    LRU = "lru"
+    LFU = "lfu"
+
+    def __init__(self, capacity: int, policy: str = LRU, weigher=None, ttl: float = None,
+                 on_evict=None) -> None:
+        if policy not in (Cache.LRU, Cache.LFU):
+            raise ValueError("Policy must be lru or lfu")
+        self.capacity = capacity
+        self.policy = policy
+        self.weigher = weigher
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.table = HashTable()
+        self.order = DoublyLinkedList()
+        self.weight = 0
+        self.stats = CacheStats()
+
+    def get(self, key, default=None):
+        """
+        :return: Item cached against key, or default on a miss
+        :complexity: O(1)
+        """
+        entry = self.table.get(key)
+        if entry is not None and self.ttl is not None and entry.expires <= time.monotonic():
+            self._remove(entry)
+            self.stats.expirations += 1
+            if self.on_evict is not None:
+                self.on_evict(entry.key, entry.item)
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        self._touch(entry)
+        return entry.item
+
+    def __getitem__(self, key):
+        item = self.get(key, _MISSING)
+        if item is _MISSING:
+            raise KeyError("Item not found")
+        return item
+
+    def put(self, key, item) -> None:
+        """
+        Caches item against key, replacing any previous item,
+        after evicting entries until the new one fits.
+        An item heavier than the whole capacity is not cached
+        :complexity: O(1) per entry evicted
+        """
+        weight = 1 if self.weigher is None else self.weigher(key, item)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        entry = self.table.get(key)
+        if entry is not None:
+            self._remove(entry)
+        if weight > self.capacity:
+            return
+        while self.weight + weight > self.capacity:
+            self._evict()
+        entry = _Entry(key, item, weight, expires)
+        self.table[key] = entry
+        self.weight += weight
+        self._link(entry)
+
+    def __setitem__(self, key, item) -> None:
+        self.put(key, item)
+
+    def __delitem__(self, key) -> None:
+        entry = self.table.get(key)
+        if entry is None:
+            raise KeyError("Item not found")
+        self._remove(entry)
+
+    def __contains__(self, key) -> bool:
+        """
+        True if key is cached and not expired. Does not count as a use
+        """
+        entry = self.table.get(key)
+        return entry is not None and (self.ttl is None or entry.expires > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def clear(self) -> None:
+        self.table = HashTable()
+        self.order = DoublyLinkedList()
+        self.weight = 0
+
+    def _link(self, entry: _Entry) -> None:
+        """
+        Adds a new entry to the eviction order
+        """
+        if self.policy == Cache.LRU:
+            self.order.push_front(entry)
+            return
+        bucket = self.order.sentinel.next
+        if bucket is self.order.sentinel or bucket.frequency != 1:
+            bucket = _FrequencyBucket(1)
+            self.order.push_front(bucket)
+        bucket.entries.push_front(entry)
+        entry.bucket = bucket
+
+    def _touch(self, entry: _Entry) -> None:
+        """
+        Records a use of an entry
+        """
+        if self.policy == Cache.LRU:
+            self.order.move_to_front(entry)
+            return
+        bucket = entry.bucket
+        following = bucket.next
+        if following is self.order.sentinel or following.frequency != bucket.frequency + 1:
+            following = _FrequencyBucket(bucket.frequency + 1)
+            self.order.insert_after(bucket, following)
+        bucket.entries.unlink(entry)
+        following.entries.push_front(entry)
+        entry.bucket = following
+        if bucket.entries.is_empty():
+            self.order.unlink(bucket)
+
+    def _remove(self, entry: _Entry) -> None:
+        del self.table[entry.key]
+        self.weight -= entry.weight
+        if self.policy == Cache.LRU:
+            self.order.unlink(entry)
+            return
+        bucket = entry.bucket
+        bucket.entries.unlink(entry)
+        if bucket.entries.is_empty():
+            self.order.unlink(bucket)
+
+    def _evict(self) -> None:
+        if self.policy == Cache.LRU:
+            entry = self.order.back()
+        else:
+            entry = self.order.front().entries.back()
+        self._remove(entry)
+        self.stats.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.item)
+
+    def purge_expired(self) -> int:
+        """
+        Drops every expired entry
+        :return: Number of entries dropped
+        :complexity: O(n)
+        """
+        if self.ttl is None:
+            return 0
+        now = time.monotonic()
+        if self.policy == Cache.LRU:
+            entries = list(self.order)
+        else:
+            entries = [entry for bucket in self.order for entry in bucket.entries]
+        expired = [entry for entry in entries if entry.expires <= now]
+        for entry in expired:
+            self._remove(entry)
+            self.stats.expirations += 1
+            if self.on_evict is not None:
+                self.on_evict(entry.key, entry.item)
+        return len(expired)
+
+
+def memoize(capacity: int = 128, policy: str = Cache.LRU, weigher=None, ttl: float = None, on_evict=None):
+    """
+    Decorator caching the results of a function by its arguments, which
+    must be hashable. The Cache is available as the cache attribute of
+    the decorated function
+    """
+    def decorator(function):
+        cache = Cache(capacity, policy, weigher, ttl, on_evict)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    @memoize(capacity=64)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(fibonacci(80))
+    print(fibonacci.cache.stats)
@@ -0,0 +1,263 @@
+"""
+Chunked implementations of ADTs.
+Items are kept in a list of bounded size sorted sublists
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from typing import TypeVar
+from adts import SortedList
+
+T = TypeVar('T')
+
+
+class ChunkedSortedList(SortedList[T]):
+    """
+    Sorted list stored as a list of sorted sublists of at most
+    2 * load items, with the largest item of each sublist kept in maxes.
+    A Fenwick tree over the sublist lengths maps positions to sublists.
+    It is rebuilt lazily, only when a positional lookup follows a change
+    in the number of sublists.
+    An insert or delete only moves items within one sublist, so the cost
+    of shifting stays bounded no matter how many items are held
+    """
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, load: int = DEFAULT_LOAD):
+        SortedList.__init__(self)
+        self.load = load
+        self.lists = []
+        self.maxes = []
+        self.tree = None
+
+    def add(self, item: T) -> None:
+        """
+        :complexity: O(log n) comparisons, O(load) move
+        """
+        if not self.lists:
+            self.lists.append([item])
+            self.maxes.append(item)
+            self.tree = None
+        else:
+            pos = bisect_right(self.maxes, item)
+            if pos == len(self.maxes):
+                pos -= 1
+                self.lists[pos].append(item)
+                self.maxes[pos] = item
+            else:
+                insort(self.lists[pos], item)
+            self._update_tree(pos, 1)
+            self._split(pos)
+        self.length += 1
+
+    def add_many(self, items) -> None:
+        """
+        Adds all items. Large batches are merged in and re-chunked in one pass
+        :complexity: O((n + k) log(n + k)) for a large batch of k items
+        """
+        items = sorted(items)
+        if len(items) * 8 < len(self):
+            for item in items:
+                self.add(item)
+            return
+        items = sorted(chain(chain.from_iterable(self.lists), items))
+        self.lists = [items[i:i + self.load] for i in range(0, len(items), self.load)]
+        self.maxes = [sublist[-1] for sublist in self.lists]
+        self.tree = None
+        self.length = len(items)
+
+    def _split(self, pos: int) -> None:
+        """
+        Splits the sublist at pos in half once it exceeds twice the load
+        """
+        sublist = self.lists[pos]
+        if len(sublist) <= 2 * self.load:
+            return
+        half = sublist[self.load:]
+        del sublist[self.load:]
+        self.maxes[pos] = sublist[-1]
+        self.lists.insert(pos + 1, half)
+        self.maxes.insert(pos + 1, half[-1])
+        self.tree = None
+
+    def _join(self, pos: int) -> None:
+        """
+        Removes the sublist at pos if it is empty, or merges it
+        with a neighbour once it falls below half the load
+        """
+        sublist = self.lists[pos]
+        if not sublist:
+            del self.lists[pos]
+            del self.maxes[pos]
+            self.tree = None
+            return
+        self.maxes[pos] = sublist[-1]
+        if len(sublist) < self.load // 2 and len(self.lists) > 1:
+            if pos == 0:
+                pos += 1
+            self.lists[pos - 1].extend(self.lists[pos])
+            self.maxes[pos - 1] = self.maxes[pos]
+            del self.lists[pos]
+            del self.maxes[pos]
+            self.tree = None
+            self._split(pos - 1)
+
+    def _build_tree(self) -> None:
+        """
+        Builds the Fenwick tree over sublist lengths. tree[0] is unused
+        :complexity: O(m) where m is the number of sublists
+        """
+        tree = [0] + [len(sublist) for sublist in self.lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _update_tree(self, pos: int, delta: int) -> None:
+        """
+        Adds delta to the length of sublist pos, if the tree is built
+        :complexity: O(log m)
+        """
+        if self.tree is None:
+            return
+        i = pos + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _position(self, pos: int, offset: int) -> int:
+        """
+        Converts a sublist and an offset into it to an index
+        :complexity: O(log m)
+        """
+        if self.tree is None:
+            self._build_tree()
+        index = offset
+        i = pos
+        while i > 0:
+            index += self.tree[i]
+            i -= i & -i
+        return index
+
+    def _locate(self, index: int):
+        """
+        Converts an index into a sublist and an offset into it,
+        by descending the Fenwick tree
+        :complexity: O(log m)
+        """
+        if index >= len(self) or index < -len(self):
+            raise IndexError("Index is out of bounds")
+        if index < 0:
+            index += len(self)
+        if index < len(self.lists[0]):
+            return 0, index
+        if self.tree is None:
+            self._build_tree()
+        pos = 0
+        bit = 1 << (len(self.tree) - 1).bit_length()
+        while bit:
+            next_pos = pos + bit
+            if next_pos < len(self.tree) and self.tree[next_pos] <= index:
+                pos = next_pos
+                index -= self.tree[next_pos]
+            bit >>= 1
+        return pos, index
+
+    def __getitem__(self, index: int) -> T:
+        """
+        :complexity: O(log n)
+        """
+        pos, offset = self._locate(index)
+        return self.lists[pos][offset]
+
+    def index(self, item: T) -> int:
+        """
+        :complexity: O(log n)
+        """
+        pos = bisect_left(self.maxes, item)
+        if pos == len(self.maxes):
+            raise KeyError("Item not found")
+        offset = bisect_left(self.lists[pos], item)
+        if self.lists[pos][offset] != item:
+            raise KeyError("Item not found")
+        return self._position(pos, offset)
+
+    def remove(self, item: T) -> None:
+        """
+        Locates the item without computing its index
+        :complexity: O(log n) comparisons, O(load) move
+        """
+        pos = bisect_left(self.maxes, item)
+        if pos == len(self.maxes):
+            raise KeyError("Item not found")
+        offset = bisect_left(self.lists[pos], item)
+        if self.lists[pos][offset] != item:
+            raise KeyError("Item not found")
+        self._delete(pos, offset)
+
+    def delete_at_index(self, index: int) -> None:
+        """
+        :complexity: O(log n) lookup, O(load) move
+        """
+        pos, offset = self._locate(index)
+        self._delete(pos, offset)
+
+    def _delete(self, pos: int, offset: int) -> None:
+        del self.lists[pos][offset]
+        self._update_tree(pos, -1)
+        self._join(pos)
+        self.length -= 1
+
+    def bisect_left(self, item: T) -> int:
+        pos = bisect_left(self.maxes, item)
+        if pos == len(self.maxes):
+            return len(self)
+        return self._position(pos, bisect_left(self.lists[pos], item))
+
+    def bisect_right(self, item: T) -> int:
+        pos = bisect_right(self.maxes, item)
+        if pos == len(self.maxes):
+            return len(self)
+        return self._position(pos, bisect_right(self.lists[pos], item))
+
+    def irange(self, low: T, high: T):
+        """
+        Lazily yields the items in the range low <= item <= high
+        """
+        pos = bisect_left(self.maxes, low)
+        if pos == len(self.maxes):
+            return
+        offset = bisect_left(self.lists[pos], low)
+        for sublist in self.lists[pos:]:
+            for i in range(offset, len(sublist)):
+                if high < sublist[i]:
+                    return
+                yield sublist[i]
+            offset = 0
+
+    def __iter__(self):
+        return chain.from_iterable(self.lists)
+
+    def clear(self) -> None:
+        SortedList.clear(self)
+        self.lists = []
+        self.maxes = []
+        self.tree = None
+
+
+if __name__ == "__main__":
+    my_list = ChunkedSortedList(load=2)
+    items = [4, 6, 2, 10, 3, 7, 8]
+    for item in items:
+        my_list.add(item)
+    print(my_list)
+    my_list.remove(4)
+    print(my_list)
+    print(my_list.index(8), my_list[4])
+    try:
+        print(my_list.index(4))
+    except KeyError:
+        print("Not found")
@@ -4,12 +4,28 @@ HashTable implementations
 
 __author__ = "Sadeeptha Bandara"
 
+import random
+from adts import render
+
+HASH_MASK = 2 ** 64 - 1
+
+
 class HashTable:
     """
-    HashTable that makes use of cuckoo hashing
+    HashTable that makes use of cuckoo hashing.
+    Each table mixes hash(key) with its own random seed, so keys that
+    collide in one table are spread out in the other. Elements that cannot
+    be placed within the kick limit go to a stash, which is rehashed with
+    new seeds when it outgrows its limit. The tables only grow once they
+    are 40 to 50% full, so keys with equal hash() values, which no seed
+    can separate, end up in the stash and slow lookups down instead of
+    growing the tables
     """
     DEFAULT_TBL_SIZES = [13, 7]
     DEFAULT_KICK_LIMIT = 10
+    MAX_LOAD_FACTOR = 0.5
+    GROW_ON_STASH_LOAD_FACTOR = 0.4
+    STASH_LIMIT = 4
 
     def __init__(self, size_tbl_one=DEFAULT_TBL_SIZES[0], size_tbl_two=DEFAULT_TBL_SIZES[1]):
         """
@@ -21,36 +37,106 @@ class HashTable:
         self.table_two = [None] * size_tbl_two
         self.cuckoo_limit = HashTable.DEFAULT_KICK_LIMIT
         self.table_array = [self.table_one, self.table_two]
+        self.seeds = [self.__new_seed(), self.__new_seed()]
+        self.stash = []
+        self.stash_limit = HashTable.STASH_LIMIT
+        self.length = 0
+
+    @staticmethod
+    def __new_seed():
+        return random.getrandbits(64) | 1
 
     def hash(self, key, table):
         """
-        Will hash provided key into a provided table
+        Will hash provided key into a provided table, mixing hash(key)
+        with the seed of that table
         :return: Will return hashed index to relevant table
         """
-        if self.table_array.count(table) < 0:
+        if table is self.table_one:
+            seed = self.seeds[0]
+        elif table is self.table_two:
+            seed = self.seeds[1]
+        else:
             raise ValueError("Invalid table")
-        key = int(key)
-        hash = key % len(table)
-        return hash
+        mixed = ((hash(key) & HASH_MASK) * seed) & HASH_MASK
+        return (mixed ^ (mixed >> 32)) % len(table)
 
     def insert(self, elem):
         """
-        Inserts provided element, bu hashing based on key
+        Inserts provided element, bu hashing based on key.
+        If the key is already present, its item is replaced
         :param elem: Element to be inserted. Will need to be provided in the form of a two element
                     tuple in the form of (key, item)
         :complexity: O(1) in general
-                      O(N) resizing
+                      O(N) resizing or rehashing
+        """
+        if self.__replace(elem):
+            return
+        if self.length + 1 > HashTable.MAX_LOAD_FACTOR * (len(self.table_one) + len(self.table_two)):
+            self.resize()
+        prev_elem = self.__place(elem)
+        self.length += 1
+        if prev_elem is not None:
+            self.stash.append(prev_elem)
+            if len(self.stash) <= self.stash_limit:
+                return
+            if self.length > HashTable.GROW_ON_STASH_LOAD_FACTOR * (len(self.table_one) + len(self.table_two)):
+                self.resize()
+            else:
+                self.__rehash(len(self.table_one), len(self.table_two))
+
+    def __place(self, elem):
         """
+        Inserts elem into the tables, kicking elements back and forth up to
+        the kick limit, or a multiple of log2 of the table size if larger
+        :return: The element left without a slot after the kick limit, or None
+        """
+        kick_limit = max(self.cuckoo_limit, 4 * len(self.table_one).bit_length())
         prev_elem = self.__insert_to_table(elem, self.table_one)
         kick_count = 1
         table_ind = 1
-        while prev_elem is not None:
+        while prev_elem is not None and kick_count < kick_limit:
             prev_elem = self.__insert_to_table(prev_elem, self.table_array[table_ind])
             table_ind = (table_ind + 1) % len(self.table_array)
             kick_count += 1
-            if kick_count >= self.cuckoo_limit:
-                break
-                self.resize()
+        return prev_elem
+
+    def __rehash(self, size_tbl_one, size_tbl_two):
+        """
+        Rebuilds the tables at the given sizes with new seeds, and places
+        every element again. Elements that still do not fit are stashed,
+        and the stash limit is raised to twice their number, so rehashing
+        keys that cannot be separated is not repeated on every insert
+        :complexity: O(N)
+        """
+        elems = list(self.items())
+        self.table_one = [None] * size_tbl_one
+        self.table_two = [None] * size_tbl_two
+        self.table_array = [self.table_one, self.table_two]
+        self.seeds = [self.__new_seed(), self.__new_seed()]
+        self.stash = []
+        for elem in elems:
+            prev_elem = self.__place(elem)
+            if prev_elem is not None:
+                self.stash.append(prev_elem)
+        self.stash_limit = max(HashTable.STASH_LIMIT, 2 * len(self.stash))
+
+    def __replace(self, elem):
+        """
+        Replaces the element with the same key as elem, if there is one
+        :return: True if an element was replaced
+        """
+        key = elem[0]
+        for table in self.table_array:
+            hash_ind = self.hash(key, table)
+            if table[hash_ind] is not None and table[hash_ind][0] == key:
+                table[hash_ind] = elem
+                return True
+        for i, stashed in enumerate(self.stash):
+            if stashed[0] == key:
+                self.stash[i] = elem
+                return True
+        return False
 
     def __insert_to_table(self, elem, table):
         """
@@ -79,6 +165,9 @@ class HashTable:
                 found = elem[0] == key
                 if found:
                     return elem[1]
+        for elem in self.stash:
+            if elem[0] == key:
+                return elem[1]
         raise KeyError("Item not found")
 
     def __getitem__(self, key):
@@ -92,30 +181,106 @@ class HashTable:
         except KeyError as e:
             return e.__str__()
 
+    def get(self, key, default=None):
+        """
+        :return: Item stored against key, or default if the key is not present
+        :complexity: O(1)
+        """
+        try:
+            return self.__search(key)
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, item):
+        self.insert((key, item))
+
+    def __delitem__(self, key):
+        """
+        Removes the element with the provided key
+        :complexity: O(1)
+        """
+        for table in self.table_array:
+            hash_ind = self.hash(key, table)
+            if table[hash_ind] is not None and table[hash_ind][0] == key:
+                table[hash_ind] = None
+                self.length -= 1
+                return
+        for i, elem in enumerate(self.stash):
+            if elem[0] == key:
+                del self.stash[i]
+                self.length -= 1
+                return
+        raise KeyError("Item not found")
+
+    def __contains__(self, key):
+        for table in self.table_array:
+            elem = table[self.hash(key, table)]
+            if elem is not None and elem[0] == key:
+                return True
+        return any(elem[0] == key for elem in self.stash)
+
+    def __len__(self):
+        return self.length
+
+    def items(self):
+        """
+        Yields the (key, item) elements of both tables and the stash
+        """
+        for table in self.table_array:
+            for elem in table:
+                if elem is not None:
+                    yield elem
+        yield from self.stash
+
+    def __iter__(self):
+        """
+        Yields the keys
+        """
+        for elem in self.items():
+            yield elem[0]
+
     def resize(self, *tables):
         """
-        Will resize provided tables
+        Will resize provided tables, or both if none are provided, to a bit
+        over twice their size, and rehash every element with new seeds
         :param tables: Tables to be resized.
+        :complexity: O(N)
         """
         for table in tables:
-            if self.table_array.count(table) < 0:
+            if table is not self.table_one and table is not self.table_two:
                 raise ValueError("Invalid table")
+        if not tables:
+            tables = self.table_array
+        sizes = [len(table) * 2 + 1 if any(table is resized for resized in tables) else len(table)
+                 for table in self.table_array]
+        self.__rehash(*sizes)
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickles the (key, item) elements rather than the tables. Hashes of
+        str and bytes keys differ between processes, so the elements are
+        reinserted on load instead of keeping their slots
+        """
+        return type(self), (len(self.table_one), len(self.table_two)), (self.cuckoo_limit, list(self.items()))
+
+    def __setstate__(self, state):
+        kick_limit, elems = state
+        self.set_kick_limit(kick_limit)
+        for elem in elems:
+            self.insert(elem)
 
     def set_kick_limit(self, kick_limit):
-        """Set appropriate kick limit. Overrides default"""
+        """Set appropriate kick limit. Overrides default. Large tables may kick more"""
         self.cuckoo_limit = kick_limit
 
     def __str__(self):
         """
         String representation of insertions.
         """
-        return_string = ""
-        for table in self.table_array:
-            return_string += "["
-            for elem in table:
-                return_string += elem.__str__() + ", "
-            return_string += "]"
-        return return_string
+        return render(self.items(), len(self))
+
+    def __repr__(self):
+        return "HashTable({})".format(render(self.items(), len(self), repr))
 
 
 if __name__ == "__main__":
@@ -29,6 +29,9 @@ class LinkedList(List, Generic[T]):
         self.head = None
 
     def insert(self, item: T, index: int) -> None:
+        if index == len(self) and index > 0:
+            self.append(item)
+            return
         if index == 0:
             temp = self.head
             self.head = Node(item)
@@ -48,6 +51,25 @@ class LinkedList(List, Generic[T]):
             parent.next = Node(item)
         self.length += 1
 
+    def extend(self, items) -> None:
+        """
+        Appends all items in order, walking to the final node only once
+        :complexity: O(n + k) where k is the number of items
+        """
+        items = iter(items)
+        if self.is_empty():
+            for item in items:
+                self.head = Node(item)
+                self.length += 1
+                break
+            else:
+                return
+        current = self._go_to_final_elem()
+        for item in items:
+            current.next = Node(item)
+            current = current.next
+            self.length += 1
+
     def __setitem__(self, index: int, item: T) -> None:
         if index >= len(self):
             raise IndexError("Index is out of bounds")
@@ -77,10 +99,14 @@ class LinkedList(List, Generic[T]):
             raise IndexError("Index is out of bounds")
 
         if index == 0:
+            item = self.head.item
             self.head = self.head.next
         else:
             parent = self._goto_parent(index)
+            item = parent.next.item
             parent.next = parent.next.next
+        self.length -= 1
+        return item
 
     def _goto_parent(self, index: int) -> T:
         if index >= len(self):
@@ -113,14 +139,116 @@ class LinkedList(List, Generic[T]):
             index += 1
         raise KeyError("Item not found")
 
-    def __str__(self):
-        return_string = "["
+    def __iter__(self):
+        """
+        :complexity: O(1) per item
+        """
         current = self.head
         while current is not None:
-            return_string += str(current) + ", "
+            yield current.item
+            current = current.next
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickles the items as a flat list. Pickling the nodes themselves
+        would recurse once per node
+        """
+        return type(self), (), list(self)
+
+    def __setstate__(self, items: list) -> None:
+        self.extend(items)
+
+
+class DoubleNode(Node[T]):
+    def __init__(self, item: T = None) -> None:
+        Node.__init__(self, item)
+        self.previous = None
+
+
+class DoublyLinkedList(Generic[T]):
+    """
+    Intrusive doubly linked list of DoubleNodes, around a sentinel node.
+    Callers hold on to the nodes they add, so a node can be unlinked or
+    moved without searching for it. Subclass DoubleNode to carry extra fields
+    """
+    def __init__(self) -> None:
+        self.sentinel = DoubleNode()
+        self.sentinel.next = self.sentinel
+        self.sentinel.previous = self.sentinel
+        self.length = 0
+
+    def insert_after(self, node: DoubleNode, new_node: DoubleNode) -> None:
+        """
+        :complexity: O(1)
+        """
+        new_node.previous = node
+        new_node.next = node.next
+        node.next.previous = new_node
+        node.next = new_node
+        self.length += 1
+
+    def push_front(self, node: DoubleNode) -> None:
+        """
+        :complexity: O(1)
+        """
+        self.insert_after(self.sentinel, node)
+
+    def push_back(self, node: DoubleNode) -> None:
+        """
+        :complexity: O(1)
+        """
+        self.insert_after(self.sentinel.previous, node)
+
+    def unlink(self, node: DoubleNode) -> None:
+        """
+        Removes a node that is in this list
+        :complexity: O(1)
+        """
+        node.previous.next = node.next
+        node.next.previous = node.previous
+        node.previous = None
+        node.next = None
+        self.length -= 1
+
+    def move_to_front(self, node: DoubleNode) -> None:
+        """
+        :complexity: O(1)
+        """
+        self.unlink(node)
+        self.push_front(node)
+
+    def front(self) -> DoubleNode:
+        if self.is_empty():
+            raise IndexError("List is empty")
+        return self.sentinel.next
+
+    def back(self) -> DoubleNode:
+        if self.is_empty():
+            raise IndexError("List is empty")
+        return self.sentinel.previous
+
+    def pop_back(self) -> DoubleNode:
+        """
+        :complexity: O(1)
+        """
+        node = self.back()
+        self.unlink(node)
+        return node
+
+    def __iter__(self):
+        """
+        Yields the nodes from front to back
+        """
+        current = self.sentinel.next
+        while current is not self.sentinel:
+            yield current
             current = current.next
-        return_string += "]"
-        return return_string
+
+    def __len__(self) -> int:
+        return self.length
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,579 @@
+"""
+Persistent implementations of ADTs.
+Updates leave the original untouched and return a new version, which
+shares all but O(log n) of its structure with the original, so keeping
+a snapshot costs nothing
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+from typing import TypeVar
+from adts import List, Queue
+
+T = TypeVar('T')
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+# Vector: 32 way bit partitioned trie
+# ==================================================================
+class _VectorNode:
+    """
+    Node of the trie. Holds up to WIDTH children, or items at the leaves.
+    edit is the token of the transient that created it, which is the
+    only one allowed to change it in place
+    """
+    def __init__(self, edit, array: list) -> None:
+        self.edit = edit
+        self.array = array
+
+
+_EMPTY_NODE = _VectorNode(None, [])
+
+
+def _editable(node: _VectorNode, edit) -> _VectorNode:
+    """
+    Returns node if it belongs to the transient with token edit,
+    otherwise a copy of it that does. A persistent update passes None
+    and so always copies
+    """
+    if edit is not None and node.edit is edit:
+        return node
+    return _VectorNode(edit, node.array[:])
+
+
+def _new_path(level: int, node: _VectorNode, edit) -> _VectorNode:
+    """
+    Chain of single child nodes from level down to node
+    """
+    while level > 0:
+        node = _VectorNode(edit, [node])
+        level -= BITS
+    return node
+
+
+def _push_tail(count: int, level: int, parent: _VectorNode, tail_node: _VectorNode, edit) -> _VectorNode:
+    """
+    Adds a full tail as the last leaf of the trie under parent, copying
+    the nodes on the path to it. count includes the tail being pushed
+    """
+    result = _editable(parent, edit)
+    sub_index = ((count - 1) >> level) & MASK
+    if level == BITS:
+        child = tail_node
+    elif sub_index < len(parent.array):
+        child = _push_tail(count, level - BITS, parent.array[sub_index], tail_node, edit)
+    else:
+        child = _new_path(level - BITS, tail_node, edit)
+    if sub_index < len(result.array):
+        result.array[sub_index] = child
+    else:
+        result.array.append(child)
+    return result
+
+
+def _pop_tail(count: int, level: int, node: _VectorNode, edit):
+    """
+    Removes the last leaf of the trie under node, copying the nodes on
+    the path to it. Returns None if node is left empty
+    """
+    sub_index = ((count - 2) >> level) & MASK
+    if level > BITS:
+        child = _pop_tail(count, level - BITS, node.array[sub_index], edit)
+        if child is None and sub_index == 0:
+            return None
+        result = _editable(node, edit)
+        if child is None:
+            del result.array[sub_index:]
+        else:
+            result.array[sub_index] = child
+        return result
+    if sub_index == 0:
+        return None
+    result = _editable(node, edit)
+    del result.array[sub_index:]
+    return result
+
+
+def _assoc(level: int, node: _VectorNode, index: int, item, edit) -> _VectorNode:
+    """
+    Sets the item at index under node, copying the nodes on the path to it
+    """
+    result = _editable(node, edit)
+    if level == 0:
+        result.array[index & MASK] = item
+    else:
+        sub_index = (index >> level) & MASK
+        result.array[sub_index] = _assoc(level - BITS, node.array[sub_index], index, item, edit)
+    return result
+
+
+class _Vector(List[T]):
+    """
+    Fields and read operations shared by the persistent and transient vectors.
+    Items are kept in a trie of nodes of WIDTH children, except for the
+    last, partially filled, leaf which is kept in tail, so appending
+    only touches the trie once every WIDTH items
+    """
+    def __init__(self) -> None:
+        List.__init__(self)
+        self.shift = BITS
+        self.root = _EMPTY_NODE
+        self.tail = []
+
+    def _tail_offset(self) -> int:
+        if len(self) < WIDTH:
+            return 0
+        return ((len(self) - 1) >> BITS) << BITS
+
+    def _leaf(self, index: int) -> list:
+        """
+        Array of WIDTH items holding index
+        :complexity: O(log32 n)
+        """
+        if index >= self._tail_offset():
+            return self.tail
+        node = self.root
+        for level in range(self.shift, 0, -BITS):
+            node = node.array[(index >> level) & MASK]
+        return node.array
+
+    def __getitem__(self, index: int) -> T:
+        """
+        :complexity: O(log32 n)
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("Index is out of bounds")
+        return self._leaf(index)[index & MASK]
+
+    def index(self, item: T) -> int:
+        """
+        :complexity: O(n)
+        """
+        for index, current in enumerate(self):
+            if current == item:
+                return index
+        raise KeyError("Item not found")
+
+    def __iter__(self):
+        """
+        Yields the items a leaf at a time
+        """
+        for start in range(0, self._tail_offset(), WIDTH):
+            yield from self._leaf(start)
+        yield from self.tail
+
+
+class PersistentVector(_Vector[T]):
+    """
+    Immutable List. set, append, pop, insert, delete_at_index and remove
+    return a new vector and leave this one unchanged.
+    set, append and pop copy one path of the trie, O(log32 n).
+    insert and delete_at_index other than at the end rebuild the vector, O(n).
+    For many updates in a row, use transient() and persistent()
+    """
+    def __init__(self, items=None) -> None:
+        _Vector.__init__(self)
+        if items is not None:
+            transient = TransientVector()
+            transient.extend(items)
+            self._take(transient.persistent())
+
+    def _take(self, vector: _Vector) -> None:
+        self.length = vector.length
+        self.shift = vector.shift
+        self.root = vector.root
+        self.tail = vector.tail
+
+    def _version(self, length: int, shift: int, root: _VectorNode, tail: list) -> "PersistentVector[T]":
+        version = PersistentVector()
+        version.length = length
+        version.shift = shift
+        version.root = root
+        version.tail = tail
+        return version
+
+    def __setitem__(self, index: int, item: T):
+        raise TypeError("PersistentVector is immutable. Use set instead")
+
+    def set(self, index: int, item: T) -> "PersistentVector[T]":
+        """
+        :complexity: O(log32 n)
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("Index is out of bounds")
+        if index >= self._tail_offset():
+            tail = self.tail[:]
+            tail[index & MASK] = item
+            return self._version(len(self), self.shift, self.root, tail)
+        root = _assoc(self.shift, self.root, index, item, None)
+        return self._version(len(self), self.shift, root, self.tail)
+
+    def append(self, item: T) -> "PersistentVector[T]":
+        """
+        :complexity: O(1) while the tail has room, O(log32 n) otherwise
+        """
+        if len(self) - self._tail_offset() < WIDTH:
+            return self._version(len(self) + 1, self.shift, self.root, self.tail + [item])
+        shift, root = _grow(len(self) + 1, self.shift, self.root, _VectorNode(None, self.tail), None)
+        return self._version(len(self) + 1, shift, root, [item])
+
+    def pop(self) -> "PersistentVector[T]":
+        """
+        Vector without its last item
+        :complexity: O(log32 n)
+        """
+        if self.is_empty():
+            raise IndexError("Vector is empty")
+        if len(self) - self._tail_offset() > 1:
+            return self._version(len(self) - 1, self.shift, self.root, self.tail[:-1])
+        tail = self._leaf(len(self) - 2) if len(self) > 1 else []
+        shift, root = _shrink(len(self), self.shift, self.root, None)
+        return self._version(len(self) - 1, shift, root, tail)
+
+    def insert(self, item: T, index: int) -> "PersistentVector[T]":
+        """
+        :complexity: O(1) at the end, O(n) otherwise
+        """
+        if index > len(self):
+            raise IndexError("Index is out of bounds")
+        if index == len(self):
+            return self.append(item)
+        items = list(self)
+        items.insert(index, item)
+        return PersistentVector(items)
+
+    def delete_at_index(self, index: int) -> "PersistentVector[T]":
+        """
+        :complexity: O(log32 n) at the end, O(n) otherwise
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("Index is out of bounds")
+        if index == len(self) - 1:
+            return self.pop()
+        items = list(self)
+        del items[index]
+        return PersistentVector(items)
+
+    def remove(self, item: T) -> "PersistentVector[T]":
+        return self.delete_at_index(self.index(item))
+
+    def extend(self, items) -> "PersistentVector[T]":
+        """
+        Appends all items through a transient, so only the new version's
+        own nodes are copied
+        :complexity: O(k) where k is the number of items
+        """
+        transient = self.transient()
+        transient.extend(items)
+        return transient.persistent()
+
+    def clear(self) -> "PersistentVector[T]":
+        return PersistentVector()
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickles the items, rebuilding the trie on load
+        """
+        return type(self), (list(self),)
+
+    def transient(self) -> "TransientVector[T]":
+        """
+        Mutable copy sharing this vector's trie, for fast batches of updates
+        :complexity: O(1)
+        """
+        return TransientVector(self)
+
+
+def _grow(count: int, shift: int, root: _VectorNode, tail_node: _VectorNode, edit):
+    """
+    Pushes a full tail into the trie, adding a level if the root is full.
+    count includes the tail being pushed
+    :return: (shift, root)
+    """
+    if ((count - 1) >> BITS) > (1 << shift):
+        return shift + BITS, _VectorNode(edit, [root, _new_path(shift, tail_node, edit)])
+    return shift, _push_tail(count - 1, shift, root, tail_node, edit)
+
+
+def _shrink(count: int, shift: int, root: _VectorNode, edit):
+    """
+    Removes the last leaf from the trie, dropping a level if the root is
+    left with a single child
+    :return: (shift, root)
+    """
+    root = _pop_tail(count, shift, root, edit)
+    if root is None:
+        return BITS, _EMPTY_NODE
+    if shift > BITS and len(root.array) == 1:
+        return shift - BITS, root.array[0]
+    return shift, root
+
+
+class TransientVector(_Vector[T]):
+    """
+    Mutable List that shares the trie of the vector it was made from.
+    Nodes are copied the first time it changes them and are then owned
+    by it, so later changes on the same path are made in place.
+    persistent() returns an immutable vector, after which the transient
+    can no longer be changed
+    """
+    def __init__(self, vector: _Vector = None) -> None:
+        _Vector.__init__(self)
+        self.edit = object()
+        if vector is not None:
+            self.length = vector.length
+            self.shift = vector.shift
+            self.root = vector.root
+            self.tail = vector.tail[:]
+
+    def _check_editable(self) -> None:
+        if self.edit is None:
+            raise RuntimeError("Transient used after persistent() was called")
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """
+        :complexity: O(log32 n)
+        """
+        self._check_editable()
+        if index < 0 or index >= len(self):
+            raise IndexError("Index is out of bounds")
+        if index >= self._tail_offset():
+            self.tail[index & MASK] = item
+        else:
+            self.root = _assoc(self.shift, self.root, index, item, self.edit)
+
+    def append(self, item: T) -> None:
+        """
+        :complexity: O(1) amortized
+        """
+        self._check_editable()
+        if len(self) - self._tail_offset() == WIDTH:
+            self.shift, self.root = _grow(len(self) + 1, self.shift, self.root,
+                                          _VectorNode(self.edit, self.tail), self.edit)
+            self.tail = []
+        self.tail.append(item)
+        self.length += 1
+
+    def pop(self) -> T:
+        """
+        Removes and returns the last item
+        :complexity: O(1) amortized
+        """
+        self._check_editable()
+        if self.is_empty():
+            raise IndexError("Vector is empty")
+        item = self.tail.pop()
+        if not self.tail and len(self) > 1:
+            self.tail = self._leaf(len(self) - 2)[:]
+            self.shift, self.root = _shrink(len(self), self.shift, self.root, self.edit)
+        self.length -= 1
+        return item
+
+    def insert(self, item: T, index: int) -> None:
+        """
+        :complexity: O(1) at the end, O(n) otherwise
+        """
+        if index > len(self):
+            raise IndexError("Index is out of bounds")
+        if index == len(self):
+            self.append(item)
+            return
+        items = list(self)
+        items.insert(index, item)
+        self._rebuild(items)
+
+    def delete_at_index(self, index: int) -> T:
+        """
+        :complexity: O(1) at the end, O(n) otherwise
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("Index is out of bounds")
+        if index == len(self) - 1:
+            return self.pop()
+        items = list(self)
+        item = items.pop(index)
+        self._rebuild(items)
+        return item
+
+    def _rebuild(self, items: list) -> None:
+        self._check_editable()
+        _Vector.__init__(self)
+        self.extend(items)
+
+    def clear(self) -> None:
+        self._check_editable()
+        _Vector.__init__(self)
+
+    def persistent(self) -> PersistentVector[T]:
+        """
+        :complexity: O(1)
+        """
+        self._check_editable()
+        self.edit = None
+        vector = PersistentVector()
+        vector._take(self)
+        return vector
+
+
+# Queue: real-time queue
+# ==================================================================
+class _Lazy:
+    """
+    Memoized suspension. A stream is a _Lazy whose value is None when
+    empty, or a (head, rest) pair where rest is another stream
+    """
+    def __init__(self, thunk=None, value=None) -> None:
+        self.thunk = thunk
+        self.value = value
+
+    def force(self):
+        if self.thunk is not None:
+            self.value = self.thunk()
+            self.thunk = None
+        return self.value
+
+
+_EMPTY_STREAM = _Lazy()
+
+
+def _rotate(front: _Lazy, rear, accumulator: _Lazy) -> _Lazy:
+    """
+    Lazily computes front ++ reversed(rear) ++ accumulator, one cell per
+    force, given that rear is one longer than front.
+    rear is a cons list of (head, rest) pairs, newest first
+    """
+    def thunk():
+        cell = front.force()
+        head, rest = rear
+        if cell is None:
+            return head, accumulator
+        return cell[0], _rotate(cell[1], rest, _Lazy(value=(head, accumulator)))
+    return _Lazy(thunk)
+
+
+class PersistentQueue(Queue[T]):
+    """
+    Immutable Queue with O(1) worst case operations, as a real-time queue.
+    Items are served from a lazy front stream and appended to a rear list.
+    The rear is rotated onto the front when it grows longer than it, and
+    every operation forces one more cell of the schedule, so the work of
+    the rotation is spread out and never repeated by older versions.
+    append returns a new queue, and serve returns (item, new queue)
+    """
+    def __init__(self, items=()) -> None:
+        """
+        :complexity: O(n) where n is the number of items
+        """
+        Queue.__init__(self)
+        self.front = _EMPTY_STREAM
+        for item in reversed(list(items)):
+            self.front = _Lazy(value=(item, self.front))
+            self.length += 1
+        self.rear = None
+        self.schedule = self.front
+
+    def _version(self, length: int, front: _Lazy, rear, schedule: _Lazy) -> "PersistentQueue[T]":
+        version = PersistentQueue()
+        version.length = length
+        cell = schedule.force()
+        if cell is not None:
+            version.front = front
+            version.rear = rear
+            version.schedule = cell[1]
+        else:
+            version.front = _rotate(front, rear, _EMPTY_STREAM)
+            version.rear = None
+            version.schedule = version.front
+        return version
+
+    def append(self, item: T) -> "PersistentQueue[T]":
+        """
+        :complexity: O(1)
+        """
+        return self._version(len(self) + 1, self.front, (item, self.rear), self.schedule)
+
+    def peek(self) -> T:
+        """
+        :complexity: O(1)
+        """
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        return self.front.force()[0]
+
+    def serve(self):
+        """
+        :return: (item at the front, queue without it)
+        :complexity: O(1)
+        """
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        item, rest = self.front.force()
+        return item, self._version(len(self) - 1, rest, self.rear, self.schedule)
+
+    def extend(self, items) -> "PersistentQueue[T]":
+        """
+        :complexity: O(k) where k is the number of items
+        """
+        queue = self
+        for item in items:
+            queue = queue.append(item)
+        return queue
+
+    def serve_many(self, count: int):
+        """
+        :return: (list of the items served, queue without them)
+        :complexity: O(k) where k is the count
+        """
+        if count < 0:
+            raise ValueError("Count must be non-negative")
+        if count > len(self):
+            raise IndexError("Queue has fewer than {} items".format(count))
+        items = []
+        queue = self
+        for _ in range(count):
+            item, queue = queue.serve()
+            items.append(item)
+        return items, queue
+
+    def is_full(self) -> bool:
+        return False
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickles the items, since the suspended rotations are closures
+        """
+        return type(self), (list(self),)
+
+    def clear(self) -> "PersistentQueue[T]":
+        return PersistentQueue()
+
+    def __iter__(self):
+        stream = self.front.force()
+        while stream is not None:
+            yield stream[0]
+            stream = stream[1].force()
+        rear = []
+        cell = self.rear
+        while cell is not None:
+            rear.append(cell[0])
+            cell = cell[1]
+        yield from reversed(rear)
+
+
+if __name__ == "__main__":
+    first = PersistentVector(range(100))
+    second = first.set(50, -1).append(100)
+    print(first[50], second[50], len(first), len(second))
+
+    transient = second.transient()
+    for item in range(1000):
+        transient.append(item)
+    third = transient.persistent()
+    print(len(second), len(third), third[1100])
+
+    queue = PersistentQueue([1, 2, 3])
+    item, served = queue.serve()
+    print(item, queue, served.append(4))
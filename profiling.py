@@ -0,0 +1,204 @@
+"""
+Profiling hooks for the ADT implementations.
+Counts calls to the PROFILED_METHODS of each ADT, resize events and items
+moved, and times a sample of calls into log2 latency histograms.
+Profiling works by replacing methods with wrappers, either on one instance
+or on every class, and putting the plain methods back when disabled, so a
+container that is not profiled pays nothing on its hot paths
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+import functools
+import time
+import types
+from adts import Stack, Queue, List, SortedList, PriorityQueue
+
+DEFAULT_SAMPLE_RATE = 64
+HISTOGRAM_BUCKETS = 64
+
+# Items moved by a call, for containers backed by an array.
+# Only ArrayList style insert(index, item) has an array, so index is args[0]
+MOVED_ITEMS = {
+    "_resize": lambda container, args: len(container),
+    "insert": lambda container, args: max(0, len(container) - args[0]) if args else 0,
+    "insert_many": lambda container, args: max(0, len(container) - args[0]) if args else 0,
+    "delete_at_index": lambda container, args: max(0, len(container) - args[0] - 1) if args else 0,
+    "add": lambda container, args: len(container) - container.bisect_right(args[0]) if args else 0,
+    "add_many": lambda container, args: _merge_moves(container, args[0]) if args else 0,
+}
+
+
+def _merge_moves(container, items) -> int:
+    """
+    Items moved by SortedArrayList.add_many, which shifts every item larger
+    than the smallest one added. An iterator cannot be inspected without
+    consuming it, so for one every item is counted
+    """
+    if not hasattr(items, "__len__"):
+        return len(container)
+    if len(items) == 0:
+        return 0
+    return len(container) - container.bisect_right(min(items))
+
+
+class OperationStats:
+    """
+    Per container counts of calls, resize events and items moved, and a
+    histogram of sampled latencies per method, where bucket b counts calls
+    that took under 2 ** b nanoseconds
+    """
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE) -> None:
+        self.sample_rate = sample_rate
+        self.calls = {}
+        self.histograms = {}
+        self.resizes = 0
+        self.moved = 0
+        self.active = set()
+
+    def record_latency(self, name: str, nanoseconds: int) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = [0] * HISTOGRAM_BUCKETS
+        histogram[min(nanoseconds.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def summary(self) -> dict:
+        """
+        :return: Calls per method, with the sampled latency histogram keyed by
+                 the upper bound of each non-empty bucket in nanoseconds
+        """
+        methods = {}
+        for name, calls in self.calls.items():
+            histogram = self.histograms.get(name, [])
+            methods[name] = {
+                "calls": calls,
+                "sampled": sum(histogram),
+                "latency_ns": {2 ** bucket: count for bucket, count in enumerate(histogram) if count},
+            }
+        return {"methods": methods, "resizes": self.resizes, "moved": self.moved}
+
+    def __str__(self):
+        lines = ["resizes: {}, items moved: {}".format(self.resizes, self.moved)]
+        for name, method in self.summary()["methods"].items():
+            lines.append("{}: {} calls, {} sampled".format(name, method["calls"], method["sampled"]))
+        return "\n".join(lines)
+
+
+def _profiled(function, name: str, sample_rate: int):
+    """
+    Wraps a method so that each call is counted against the stats of the
+    container it is called on, and one call in sample_rate is timed.
+    Only the outermost call of each method is counted, so an override that
+    calls the base class method it replaces, also wrapped, counts once
+    """
+    moved = MOVED_ITEMS.get(name)
+    resize = name == "_resize"
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        try:
+            stats = self.op_stats
+        except AttributeError:
+            stats = self.op_stats = OperationStats(sample_rate)
+        if name in stats.active:
+            return function(self, *args, **kwargs)
+        calls = stats.calls.get(name, 0) + 1
+        stats.calls[name] = calls
+        if resize:
+            stats.resizes += 1
+        if moved is not None and hasattr(self, "array"):
+            stats.moved += moved(self, args)
+        start = None if calls % stats.sample_rate else time.perf_counter_ns()
+        stats.active.add(name)
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            stats.active.discard(name)
+            if start is not None:
+                stats.record_latency(name, time.perf_counter_ns() - start)
+
+    wrapper.profiled = True
+    return wrapper
+
+
+def _unwrap(function):
+    while getattr(function, "profiled", False):
+        function = function.__wrapped__
+    return function
+
+
+def _classes():
+    """
+    The ADT base classes and every subclass imported so far
+    """
+    pending = [Stack, Queue, List, SortedList, PriorityQueue]
+    seen = []
+    while pending:
+        cls = pending.pop()
+        if cls not in seen:
+            seen.append(cls)
+            pending.extend(cls.__subclasses__())
+    return seen
+
+
+def enable(target=None, sample_rate: int = DEFAULT_SAMPLE_RATE) -> None:
+    """
+    Starts profiling a single container, every instance of a class,
+    or, with no target, every ADT implementation imported so far
+    :param sample_rate: Time one call in every sample_rate, per method
+    """
+    if target is None:
+        for cls in _classes():
+            enable(cls, sample_rate)
+    elif isinstance(target, type):
+        for name in getattr(target, "PROFILED_METHODS", ()):
+            function = target.__dict__.get(name)
+            if isinstance(function, types.FunctionType) and not getattr(function, "profiled", False):
+                setattr(target, name, _profiled(function, name, sample_rate))
+    else:
+        for name in getattr(target, "PROFILED_METHODS", ()):
+            function = getattr(type(target), name, None)
+            if function is not None:
+                wrapper = _profiled(_unwrap(function), name, sample_rate)
+                setattr(target, name, types.MethodType(wrapper, target))
+
+
+def disable(target=None) -> None:
+    """
+    Puts the plain methods back on a container, a class, or with
+    no target, on every class. Collected stats are kept
+    """
+    if target is None:
+        for cls in _classes():
+            disable(cls)
+    elif isinstance(target, type):
+        for name in getattr(target, "PROFILED_METHODS", ()):
+            function = target.__dict__.get(name)
+            if getattr(function, "profiled", False):
+                setattr(target, name, _unwrap(function))
+    else:
+        for name in getattr(target, "PROFILED_METHODS", ()):
+            target.__dict__.pop(name, None)
+
+
+def stats(container) -> OperationStats:
+    """
+    Stats collected for a container, or None if it has not been profiled
+    """
+    return container.__dict__.get("op_stats")
+
+
+def reset(container) -> None:
+    container.__dict__.pop("op_stats", None)
+
+
+if __name__ == "__main__":
+    from array_implementations import ArrayList
+
+    my_list = ArrayList()
+    enable(my_list, sample_rate=1)
+    for item in range(100):
+        my_list.insert(0, item)
+    my_list.index(0)
+    disable(my_list)
+    print(stats(my_list))
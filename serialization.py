@@ -0,0 +1,96 @@
+"""
+Streaming serialization of containers to files, for checkpointing.
+Each record is a protocol 5 pickle whose typed buffers are written
+out-of-band, straight from the backing arrays, after the pickle itself:
+    pickle length, buffer count, pickle, then each buffer length and bytes
+Buffers are read back into writable bytearrays that a NumpyArrayList
+uses as its backing array without copying. Records can be appended to
+the same file and loaded back one at a time
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+import pickle
+import struct
+
+HEADER = struct.Struct("<QI")
+BUFFER_HEADER = struct.Struct("<Q")
+
+
+def dump(container, file) -> int:
+    """
+    Writes one record holding container to a binary file
+    :return: Number of bytes written
+    :complexity: O(n), with typed items written without an intermediate copy
+    """
+    buffers = []
+    data = pickle.dumps(container, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    file.write(HEADER.pack(len(data), len(raws)))
+    file.write(data)
+    written = HEADER.size + len(data)
+    for raw in raws:
+        file.write(BUFFER_HEADER.pack(raw.nbytes))
+        file.write(raw)
+        written += BUFFER_HEADER.size + raw.nbytes
+    return written
+
+
+def load(file):
+    """
+    Reads the next record from a binary file
+    :return: The container
+    :raises EOFError: If there are no more records
+    :raises pickle.UnpicklingError: If the record is cut short
+    """
+    header = file.read(HEADER.size)
+    if not header:
+        raise EOFError("No more records")
+    if len(header) != HEADER.size:
+        raise pickle.UnpicklingError("Record is incomplete")
+    data_length, count = HEADER.unpack(header)
+    data = _read(file, data_length)
+    buffers = []
+    for _ in range(count):
+        length, = BUFFER_HEADER.unpack(_read(file, BUFFER_HEADER.size))
+        buffer = bytearray(length)
+        if file.readinto(buffer) != length:
+            raise pickle.UnpicklingError("Record is incomplete")
+        buffers.append(buffer)
+    return pickle.loads(data, buffers=buffers)
+
+
+def load_all(file):
+    """
+    Lazily yields every record left in a binary file
+    """
+    while True:
+        try:
+            yield load(file)
+        except EOFError:
+            return
+
+
+def _read(file, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise pickle.UnpicklingError("Record is incomplete")
+    return data
+
+
+if __name__ == "__main__":
+    import io
+    from array_implementations import ArrayList, CircularQueue
+
+    my_list = ArrayList(typecode="q")
+    my_list.extend(range(10))
+    my_queue = CircularQueue()
+    my_queue.extend(["a", "b", "c"])
+    my_queue.serve()
+
+    file = io.BytesIO()
+    dump(my_list, file)
+    dump(my_queue, file)
+    file.seek(0)
+    for container in load_all(file):
+        print(container)
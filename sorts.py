@@ -0,0 +1,737 @@
+"""
+Sorting algorithms.
+Sorts work in place on the backing array of the array implementations
+"""
+
+__author__ = "Sadeeptha Bandara"
+
+import array as pyarray
+import heapq
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+
+from adts import SortedList
+from array_implementations import ArrayStack, LinearQueue, CircularQueue, ArrayList, NumpyArrayList
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MIN_MERGE = 32
+MIN_GALLOP = 7
+INSERTION_THRESHOLD = 16
+DEFAULT_RUN_SIZE = 1_000_000
+READ_BLOCK_SIZE = 65536
+DIGIT_BITS = 8
+MSD_CUTOFF = 32
+
+
+def sort(container, key=None, reverse: bool = False, stable: bool = False) -> None:
+    """
+    Sorts the items of a container in place, on its backing array.
+    Accepts an ArrayList, ArrayStack, LinearQueue, CircularQueue or a Python list.
+    A NumpyArrayList without a key is handed to numpy's own stable sort.
+    Input made of a few long natural runs is merge sorted, Timsort style.
+    Anything else falls back to introsort, which is not stable, unless
+    stable is set. With a key, each key is computed once and the items
+    are moved into place by following the cycles of the permutation,
+    so the sort is always stable
+    :param key: Function computing the key of an item
+    :param reverse: Sort in descending order, keeping equal items in order
+    :param stable: Never reorder equal items
+    :complexity: O(n log n), O(n) on presorted input
+    """
+    array, low, high = _live_region(container)
+    if high - low < 2:
+        return
+    if reverse:
+        _reverse(array, low, high)
+    if key is None and isinstance(container, NumpyArrayList):
+        array[low:high].sort(kind="stable")
+    elif key is None:
+        if stable or reverse or _is_presorted(array, low, high):
+            _timsort(array, low, high)
+        else:
+            _introsort(array, low, high, 2 * (high - low).bit_length())
+    else:
+        decorated = [(key(array[i]), i - low) for i in range(low, high)]
+        if _is_presorted(decorated, 0, len(decorated)):
+            _timsort(decorated, 0, len(decorated))
+        else:
+            _introsort(decorated, 0, len(decorated), 2 * len(decorated).bit_length())
+        _permute(array, low, [index for _, index in decorated])
+    if reverse:
+        _reverse(array, low, high)
+
+
+def _live_region(container):
+    """
+    Returns (array, low, high) where array[low:high] holds the items
+    of the container in order. A wrapped CircularQueue is rotated first
+    """
+    if isinstance(container, list):
+        return container, 0, len(container)
+    if isinstance(container, SortedList):
+        raise TypeError("Items of a SortedList are already sorted")
+    if isinstance(container, CircularQueue):
+        _unwrap(container)
+        return container.array, container.front, container.front + len(container)
+    if isinstance(container, LinearQueue):
+        return container.array, container.front, container.rear
+    if isinstance(container, (ArrayList, ArrayStack)):
+        return container.array, 0, len(container)
+    raise TypeError("Cannot sort {} in place".format(type(container).__name__))
+
+
+def _unwrap(queue: CircularQueue) -> None:
+    """
+    Rotates the array of a wrapped CircularQueue so the items are contiguous
+    :complexity: O(n) where n is the capacity
+    """
+    if queue.front + len(queue) <= len(queue.array):
+        return
+    _reverse(queue.array, 0, queue.front)
+    _reverse(queue.array, queue.front, len(queue.array))
+    _reverse(queue.array, 0, len(queue.array))
+    queue.front = 0
+    queue.rear = len(queue) % len(queue.array)
+
+
+def _reverse(array, low: int, high: int) -> None:
+    high -= 1
+    while low < high:
+        array[low], array[high] = array[high], array[low]
+        low += 1
+        high -= 1
+
+
+def _permute(array, low: int, permutation) -> None:
+    """
+    Moves array[low + permutation[i]] to array[low + i] for every i,
+    following each cycle once. Consumes the permutation
+    :complexity: O(n)
+    """
+    for start in range(len(permutation)):
+        if permutation[start] == start:
+            continue
+        item = array[low + start]
+        i = start
+        while True:
+            source = permutation[i]
+            permutation[i] = i
+            if source == start:
+                array[low + i] = item
+                break
+            array[low + i] = array[low + source]
+            i = source
+
+
+def _is_presorted(array, low: int, high: int) -> bool:
+    """
+    True if array[low:high] is made up of at most n / MIN_MERGE natural runs.
+    Stops counting as soon as that limit is passed, so random input
+    is rejected after a small prefix
+    """
+    max_runs = (high - low) // MIN_MERGE
+    runs = 0
+    i = low
+    while i < high:
+        runs += 1
+        if runs > max_runs:
+            return False
+        i += _run_length(array, i, high)
+    return True
+
+
+def _run_length(array, low: int, high: int) -> int:
+    """
+    Length of the non-descending or strictly descending run starting at low
+    """
+    run_high = low + 1
+    if run_high == high:
+        return 1
+    if array[run_high] < array[low]:
+        run_high += 1
+        while run_high < high and array[run_high] < array[run_high - 1]:
+            run_high += 1
+    else:
+        run_high += 1
+        while run_high < high and not array[run_high] < array[run_high - 1]:
+            run_high += 1
+    return run_high - low
+
+
+def _count_run(array, low: int, high: int) -> int:
+    """
+    Length of the run starting at low. A strictly descending run is
+    reversed in place, which keeps the sort stable
+    """
+    length = _run_length(array, low, high)
+    if length > 1 and array[low + 1] < array[low]:
+        _reverse(array, low, low + length)
+    return length
+
+
+def _binary_insertion_sort(array, low: int, high: int, start: int) -> None:
+    """
+    Sorts array[low:high], given that array[low:start] is already sorted.
+    Each item is placed with a binary search and a single slice shift
+    :complexity: O(n log n) comparisons, O(n^2) moves
+    """
+    for i in range(start, high):
+        item = array[i]
+        pos = _gallop_right(item, array, low, i)
+        array[pos + 1:i + 1] = array[pos:i]
+        array[pos] = item
+
+
+def _gallop_right(key, array, low: int, high: int) -> int:
+    """
+    Index of the first item in array[low:high] greater than key.
+    Probes low, low + 1, low + 3, low + 7, ... then binary searches,
+    so it is O(log k) when the answer is k places from low
+    """
+    offset = 0
+    probe = low
+    start = low
+    while probe < high and not key < array[probe]:
+        low = probe + 1
+        offset = offset * 2 + 1
+        probe = start + offset
+    high = min(probe, high)
+    while low < high:
+        mid = (low + high) // 2
+        if key < array[mid]:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def _gallop_left(key, array, low: int, high: int) -> int:
+    """
+    Index of the first item in array[low:high] not less than key.
+    Probes the same way as _gallop_right
+    """
+    offset = 0
+    probe = low
+    start = low
+    while probe < high and array[probe] < key:
+        low = probe + 1
+        offset = offset * 2 + 1
+        probe = start + offset
+    high = min(probe, high)
+    while low < high:
+        mid = (low + high) // 2
+        if array[mid] < key:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def _min_run_length(n: int) -> int:
+    """
+    Run length between MIN_MERGE / 2 and MIN_MERGE such that n / length
+    is a power of two, or slightly less, which keeps merges balanced
+    """
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+# Timsort
+# ==================================================================
+class _MergeState:
+    """
+    Stack of pending runs, as [start, length] pairs, and the adaptive
+    threshold for entering galloping mode
+    """
+    def __init__(self, array) -> None:
+        self.array = array
+        self.runs = []
+        self.min_gallop = MIN_GALLOP
+
+    def merge_collapse(self) -> None:
+        """
+        Merges runs on top of the stack until the lengths of the top three
+        runs satisfy A > B + C and B > C
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self) -> None:
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, n: int) -> None:
+        """
+        Merges runs n and n + 1. Items of the first run that are not greater
+        than the first item of the second are already in place, as are items
+        of the second run not less than the last item of the first
+        """
+        array = self.array
+        a_start, a_length = self.runs[n]
+        b_start, b_length = self.runs[n + 1]
+        self.runs[n][1] = a_length + b_length
+        del self.runs[n + 1]
+
+        a_end = a_start + a_length
+        a_start = _gallop_right(array[b_start], array, a_start, a_end)
+        if a_start == a_end:
+            return
+        b_end = _gallop_left(array[a_end - 1], array, b_start, b_start + b_length)
+        self.merge_lo(a_start, a_end, b_end)
+
+    def merge_lo(self, a_start: int, a_end: int, b_end: int) -> None:
+        """
+        Merges array[a_start:a_end] with array[a_end:b_end], copying the first
+        run out to make room. After one run wins min_gallop times in a row,
+        switches to galloping, moving whole blocks found by exponential search
+        """
+        array = self.array
+        temp = array[a_start:a_end]
+        a_length = len(temp)
+        i = 0
+        j = a_end
+        k = a_start
+        min_gallop = self.min_gallop
+        while i < a_length and j < b_end:
+            a_count = 0
+            b_count = 0
+            while i < a_length and j < b_end:
+                if array[j] < temp[i]:
+                    array[k] = array[j]
+                    j += 1
+                    b_count += 1
+                    a_count = 0
+                else:
+                    array[k] = temp[i]
+                    i += 1
+                    a_count += 1
+                    b_count = 0
+                k += 1
+                if a_count >= min_gallop or b_count >= min_gallop:
+                    break
+
+            while i < a_length and j < b_end:
+                a_count = _gallop_right(array[j], temp, i, a_length) - i
+                array[k:k + a_count] = temp[i:i + a_count]
+                k += a_count
+                i += a_count
+                if i == a_length:
+                    break
+                b_count = _gallop_left(temp[i], array, j, b_end) - j
+                array[k:k + b_count] = array[j:j + b_count]
+                k += b_count
+                j += b_count
+                min_gallop = max(1, min_gallop - 1)
+                if a_count < MIN_GALLOP and b_count < MIN_GALLOP:
+                    break
+            min_gallop += 2
+        self.min_gallop = min_gallop
+        array[k:k + a_length - i] = temp[i:a_length]
+
+
+def _timsort(array, low: int, high: int) -> None:
+    """
+    Stable natural merge sort. Splits the input into natural runs,
+    extends short ones to a minimum length with binary insertion sort,
+    and merges them while keeping the run stack balanced
+    :complexity: O(n log n), O(n) on presorted input
+    """
+    if high - low < MIN_MERGE:
+        _binary_insertion_sort(array, low, high, low + _count_run(array, low, high))
+        return
+    state = _MergeState(array)
+    min_run = _min_run_length(high - low)
+    start = low
+    while start < high:
+        length = _count_run(array, start, high)
+        if length < min_run:
+            forced = min(min_run, high - start)
+            _binary_insertion_sort(array, start, start + forced, start + length)
+            length = forced
+        state.runs.append([start, length])
+        state.merge_collapse()
+        start += length
+    state.merge_force_collapse()
+
+
+# Introsort
+# ==================================================================
+def _introsort(array, low: int, high: int, depth: int) -> None:
+    """
+    Quicksort with three way partitioning, so runs of equal items are
+    handled in one pass. Switches to heapsort once the recursion depth
+    limit is reached and to insertion sort for short ranges
+    :complexity: O(n log n)
+    """
+    while high - low > INSERTION_THRESHOLD:
+        if depth == 0:
+            _heapsort(array, low, high)
+            return
+        depth -= 1
+        less, greater = _partition(array, low, high)
+        if less - low < high - greater:
+            _introsort(array, low, less, depth)
+            low = greater
+        else:
+            _introsort(array, greater, high, depth)
+            high = less
+    _binary_insertion_sort(array, low, high, low + 1)
+
+
+def _partition(array, low: int, high: int):
+    """
+    Partitions array[low:high] around the median of the first, middle
+    and last items. Returns (less, greater) such that array[less:greater]
+    holds the items equal to the pivot
+    """
+    first = array[low]
+    middle = array[(low + high) // 2]
+    last = array[high - 1]
+    if middle < first:
+        first, middle = middle, first
+    if last < middle:
+        middle = first if last < first else last
+    pivot = middle
+
+    less = low
+    i = low
+    greater = high
+    while i < greater:
+        item = array[i]
+        if item < pivot:
+            array[i] = array[less]
+            array[less] = item
+            less += 1
+            i += 1
+        elif pivot < item:
+            greater -= 1
+            array[i] = array[greater]
+            array[greater] = item
+        else:
+            i += 1
+    return less, greater
+
+
+def _heapsort(array, low: int, high: int) -> None:
+    """
+    :complexity: O(n log n)
+    """
+    length = high - low
+    for i in range(length // 2 - 1, -1, -1):
+        _sift_down(array, low, i, length)
+    for end in range(length - 1, 0, -1):
+        array[low], array[low + end] = array[low + end], array[low]
+        _sift_down(array, low, 0, end)
+
+
+def _sift_down(array, low: int, index: int, length: int) -> None:
+    item = array[low + index]
+    while True:
+        child = 2 * index + 1
+        if child >= length:
+            break
+        if child + 1 < length and array[low + child] < array[low + child + 1]:
+            child += 1
+        if not item < array[low + child]:
+            break
+        array[low + index] = array[low + child]
+        index = child
+    array[low + index] = item
+
+
+# External merge sort
+# ==================================================================
+def external_sort(source, run_size: int = DEFAULT_RUN_SIZE, typecode: str = None, key=None,
+                  workers: int = None, temp_dir: str = None):
+    """
+    Sorts more records than fit in memory. Records are read from the source
+    in runs of run_size, each run is sorted in a process pool and spilled
+    to a temporary file, then the runs are merged lazily with a heap.
+    At most workers + 1 runs are held in memory at once, plus one read
+    block per run while merging. The temporary files are removed once the
+    generator is exhausted or closed
+    :param source: Iterable of records, or path to a binary file of typecode records
+    :param run_size: Number of records sorted in memory at a time
+    :param typecode: array module typecode of the records. Runs are spilled as
+                     raw machine values. Without it, records are pickled in blocks
+    :param key: Function computing the key of a record. Must be picklable,
+                i.e. defined at module level, when workers is more than 1
+    :param workers: Number of processes sorting runs. Defaults to the core count
+    :param temp_dir: Directory for the spilled runs
+    :return: Generator over the sorted records
+    :complexity: O(n log n), with two passes over the data on disk
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        paths = _spill_runs(_read_runs(source, run_size, typecode), directory, typecode, key, workers)
+        yield from _merge_runs(paths, typecode, key)
+
+
+def _read_runs(source, run_size: int, typecode: str):
+    """
+    Yields runs of at most run_size records, as arrays when typecode is given
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if typecode is None:
+            raise ValueError("A typecode is needed to read records from a file")
+        with open(source, "rb") as file:
+            while True:
+                run = pyarray.array(typecode)
+                try:
+                    run.fromfile(file, run_size)
+                except EOFError:
+                    pass
+                if not run:
+                    return
+                yield run
+    iterator = iter(source)
+    while True:
+        run = list(islice(iterator, run_size))
+        if not run:
+            return
+        yield run if typecode is None else pyarray.array(typecode, run)
+
+
+def _spill_runs(runs, directory: str, typecode: str, key, workers: int):
+    """
+    Sorts each run and writes it to its own file in directory.
+    Waits for a worker to finish before reading more than workers + 1 runs
+    :return: Paths of the sorted runs, in input order
+    """
+    paths = []
+    if workers == 1:
+        for run in runs:
+            paths.append(_sort_run(run, os.path.join(directory, "run{}".format(len(paths))), typecode, key))
+        return paths
+    with ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        for run in runs:
+            path = os.path.join(directory, "run{}".format(len(paths)))
+            paths.append(path)
+            pending.add(pool.submit(_sort_run, run, path, typecode, key))
+            if len(pending) > workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+        for future in pending:
+            future.result()
+    return paths
+
+
+def _sort_run(run, path: str, typecode: str, key) -> str:
+    """
+    Sorts a run and writes it to path. Runs in a worker process
+    """
+    run = sorted(run, key=key)
+    with open(path, "wb") as file:
+        if typecode is not None:
+            pyarray.array(typecode, run).tofile(file)
+        else:
+            for i in range(0, len(run), READ_BLOCK_SIZE):
+                pickle.dump(run[i:i + READ_BLOCK_SIZE], file, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str, typecode: str):
+    """
+    Yields the records of a sorted run, reading one block at a time
+    """
+    with open(path, "rb") as file:
+        while True:
+            if typecode is not None:
+                block = pyarray.array(typecode)
+                try:
+                    block.fromfile(file, READ_BLOCK_SIZE)
+                except EOFError:
+                    pass
+            else:
+                try:
+                    block = pickle.load(file)
+                except EOFError:
+                    block = None
+            if not block:
+                return
+            yield from block
+
+
+def _merge_runs(paths, typecode: str, key):
+    """
+    k way merge of the sorted runs. The heap holds one (key, run, record)
+    entry per run, and ties go to the earlier run, so the merge is stable
+    :complexity: O(n log k) where k is the number of runs
+    """
+    readers = [_read_run(path, typecode) for path in paths]
+    heap = []
+    for run, reader in enumerate(readers):
+        for record in reader:
+            heap.append((record if key is None else key(record), run, record))
+            break
+    heapq.heapify(heap)
+    while heap:
+        _, run, record = heap[0]
+        yield record
+        for record in readers[run]:
+            heapq.heapreplace(heap, (record if key is None else key(record), run, record))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+# Radix and counting sorts
+# ==================================================================
+def _require_numpy(name: str) -> None:
+    if np is None:
+        raise ImportError("{} requires numpy".format(name))
+
+
+def counting_sort(keys):
+    """
+    Sorts integer keys by counting occurrences of each value.
+    Best when the range of the keys is not much larger than their number
+    :return: Sorted numpy array
+    :complexity: O(n + k) where k is the range of the keys
+    """
+    _require_numpy("counting_sort")
+    keys = np.asarray(keys)
+    if keys.dtype.kind not in "iu":
+        raise TypeError("Keys must be integers")
+    if len(keys) == 0:
+        return keys.copy()
+    wide = keys.astype(np.int64 if keys.dtype.kind == "i" else np.uint64)
+    low = wide.min()
+    counts = np.bincount((wide - low).astype(np.intp))
+    return np.repeat((low + np.arange(len(counts), dtype=wide.dtype)).astype(keys.dtype), counts)
+
+
+def radix_argsort(keys, digit_bits: int = DIGIT_BITS):
+    """
+    Stable LSD radix sort of integer keys, returning the permutation that
+    sorts them. Each pass sorts one digit of digit_bits bits with numpy's
+    stable argsort, which is a counting sort for 8 and 16 bit integers.
+    Passes stop at the highest bit in use once the minimum is subtracted
+    :param digit_bits: Bits per pass, from 1 to 16
+    :return: numpy array of indices, such that keys[result] is sorted
+    :complexity: O(n * w / digit_bits) where w is the number of bits in use
+    """
+    _require_numpy("radix_argsort")
+    if not 1 <= digit_bits <= 16:
+        raise ValueError("digit_bits must be between 1 and 16")
+    keys = np.asarray(keys)
+    if keys.dtype.kind not in "iu":
+        raise TypeError("Keys must be integers")
+    order = np.arange(len(keys))
+    if len(keys) < 2:
+        return order
+    if keys.dtype.kind == "i":
+        keys = keys.astype(np.int64)
+        keys = (keys - keys.min()).view(np.uint64)
+    else:
+        keys = keys.astype(np.uint64)
+        keys = keys - keys.min()
+    digit_type = np.uint8 if digit_bits <= 8 else np.uint16
+    mask = np.uint64((1 << digit_bits) - 1)
+    for shift in range(0, int(keys.max()).bit_length(), digit_bits):
+        digits = ((keys[order] >> np.uint64(shift)) & mask).astype(digit_type)
+        order = order[np.argsort(digits, kind="stable")]
+    return order
+
+
+def radix_sort(keys, digit_bits: int = DIGIT_BITS):
+    """
+    Sorts integer keys. Uses counting_sort when the range of the keys is
+    at most their number, and radix_argsort otherwise
+    :return: Sorted numpy array
+    """
+    _require_numpy("radix_sort")
+    keys = np.asarray(keys)
+    if len(keys) and keys.dtype.kind in "iu" and int(keys.max()) - int(keys.min()) <= len(keys):
+        return counting_sort(keys)
+    return keys[radix_argsort(keys, digit_bits)]
+
+
+def radix_sort_pairs(pairs, digit_bits: int = DIGIT_BITS) -> list:
+    """
+    Stable sort of (key, item) pairs, as stored by HashTable, by their
+    integer keys. The result can be bulk loaded into a SortedArrayList
+    with add_many, whose own sort is linear on presorted input
+    :return: New list of the pairs in key order
+    """
+    _require_numpy("radix_sort_pairs")
+    pairs = list(pairs)
+    keys = np.fromiter((pair[0] for pair in pairs), dtype=np.int64, count=len(pairs))
+    return [pairs[i] for i in radix_argsort(keys, digit_bits).tolist()]
+
+
+def msd_radix_sort(strings, width: int = None) -> list:
+    """
+    Byte wise MSD radix sort of strings, e.g. to insert words into a Trie
+    in order. Strings are UTF-8 encoded into a fixed width byte matrix,
+    padded with zero bytes, so shorter strings sort before their extensions.
+    Each bucket is split on its next byte column with numpy's stable
+    argsort, and buckets below MSD_CUTOFF strings are finished by comparison
+    :param width: Width in bytes. Defaults to the longest string
+    :return: New list of the strings in sorted order
+    :complexity: O(n * w) where w is the width
+    """
+    _require_numpy("msd_radix_sort")
+    strings = list(strings)
+    encoded = [string.encode() for string in strings]
+    if width is None:
+        width = max((len(string) for string in encoded), default=0)
+    elif any(len(string) > width for string in encoded):
+        raise ValueError("String is longer than width")
+    if len(strings) < 2 or width == 0:
+        return strings
+    matrix = np.array(encoded, dtype="S{}".format(width))
+    codes = matrix.view(np.uint8).reshape(len(strings), width)
+    order = np.arange(len(strings))
+    stack = [(0, len(strings), 0)]
+    while stack:
+        low, high, column = stack.pop()
+        segment = order[low:high]
+        if high - low <= MSD_CUTOFF:
+            order[low:high] = sorted(segment.tolist(), key=encoded.__getitem__)
+            continue
+        digits = codes[segment, column]
+        by_digit = np.argsort(digits, kind="stable")
+        order[low:high] = segment[by_digit]
+        digits = digits[by_digit]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(digits)) + 1))
+        ends = np.concatenate((starts[1:], [high - low]))
+        for start, end, digit in zip(starts.tolist(), ends.tolist(), digits[starts].tolist()):
+            if end - start > 1 and digit != 0 and column + 1 < width:
+                stack.append((low + start, low + end, column + 1))
+    return [strings[i] for i in order.tolist()]
+
+
+if __name__ == "__main__":
+    my_list = ArrayList()
+    for item in [4, 6, 2, 10, 3, 7, 8]:
+        my_list.append(item)
+    sort(my_list)
+    print(my_list)
+    sort(my_list, key=lambda item: item % 3, reverse=True)
+    print(my_list)
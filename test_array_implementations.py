@@ -0,0 +1,207 @@
+import bisect
+import pickle
+import random
+
+import pytest
+
+from array_implementations import ArrayList, LinearQueue, CircularQueue, NumpyArrayList, SortedArrayList, ArrayHeap, np
+
+requires_numpy = pytest.mark.skipif(np is None, reason="numpy is not installed")
+
+
+def test_slices_match_list():
+    rng = random.Random(0)
+    bounds = [None] + list(range(-25, 25))
+    for typecode in (None, "q"):
+        for size in (0, 1, 20):
+            array_list = ArrayList(50, typecode)
+            array_list.extend(range(size))
+            model = list(range(size))
+            for _ in range(2000):
+                index = slice(rng.choice(bounds), rng.choice(bounds), rng.choice([None, 1, 2, 3, -1, -2, -5]))
+                assert list(array_list[index]) == model[index]
+
+
+def test_empty_batches_while_viewed():
+    array_list = ArrayList(10, "q")
+    array_list.extend(range(3))
+    view = array_list.view()
+    array_list.extend([])
+    array_list.insert_many(1, [])
+    with pytest.raises(IndexError):
+        array_list.insert_many(5, [])
+    assert list(view) == [0, 1, 2]
+
+
+def test_batches_from_own_backing_array():
+    array_list = ArrayList(3)
+    array_list.extend(range(3))
+    array_list.insert_many(1, array_list.array)
+    assert list(array_list) == [0, 0, 1, 2, 1, 2]
+
+
+@pytest.mark.parametrize("queue_type", [LinearQueue, CircularQueue])
+def test_serve_many_rejects_bad_counts(queue_type):
+    queue = queue_type(8)
+    queue.extend(range(5))
+    with pytest.raises(ValueError):
+        queue.serve_many(-1)
+    with pytest.raises(IndexError):
+        queue.serve_many(6)
+    assert queue.serve_many(0) == []
+    assert len(queue) == 5
+    assert queue.serve_many(2) == [0, 1]
+    queue.extend(range(5, 10))
+    assert queue.serve_many(len(queue)) == list(range(2, 10))
+
+
+@pytest.mark.parametrize("capacity", [0, 1, 6])
+def test_sorted_array_list_matches_model(capacity):
+    rng = random.Random(capacity)
+    sorted_list = SortedArrayList(capacity)
+    model = []
+    for _ in range(2000):
+        operation = rng.random()
+        if operation < 0.35 or not model:
+            item = rng.randrange(200)
+            sorted_list.add(item)
+            bisect.insort(model, item)
+        elif operation < 0.45:
+            items = [rng.randrange(200) for _ in range(rng.randrange(6))]
+            sorted_list.add_many(items)
+            model = sorted(model + items)
+        elif operation < 0.6:
+            index = rng.randrange(len(model))
+            sorted_list.delete_at_index(index)
+            del model[index]
+        elif operation < 0.7:
+            item = rng.randrange(200)
+            if item in model:
+                assert sorted_list.index(item) == model.index(item)
+                sorted_list.remove(item)
+                model.remove(item)
+            else:
+                with pytest.raises(KeyError):
+                    sorted_list.remove(item)
+        else:
+            item = rng.randrange(-5, 205)
+            assert sorted_list.bisect_left(item) == bisect.bisect_left(model, item)
+            assert sorted_list.bisect_right(item) == bisect.bisect_right(model, item)
+            low, high = sorted((item, rng.randrange(-5, 205)))
+            assert list(sorted_list.irange(low, high)) == [x for x in model if low <= x <= high]
+        assert len(sorted_list) == len(model)
+    assert list(sorted_list) == model
+
+
+def test_sorted_array_list_without_capacity():
+    for sorted_list in (SortedArrayList(0), pickle.loads(pickle.dumps(SortedArrayList()))):
+        sorted_list.add_many([3])
+        sorted_list.add_many([2, 1])
+        assert list(sorted_list) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_heap_update_matches_model(arity):
+    rng = random.Random(arity)
+    heap = ArrayHeap(2, arity)
+    model = {}
+    for step in range(5000):
+        operation = rng.random()
+        if operation < 0.35 or not model:
+            item = rng.randrange(1000)
+            if item in model:
+                with pytest.raises(ValueError):
+                    heap.push(item, 0.0)
+            else:
+                model[item] = rng.random()
+                heap.push(item, model[item])
+        elif operation < 0.6:
+            item = rng.choice(list(model))
+            model[item] = rng.random()
+            heap.update(item, model[item])
+        elif operation < 0.7:
+            item = rng.choice(list(model))
+            priority = model[item] - rng.random()
+            heap.decrease_key(item, priority)
+            model[item] = priority
+        elif operation < 0.75:
+            entries = [(item, rng.random()) for item in rng.sample(range(1000, 2000), rng.randrange(20))]
+            entries = [(item, priority) for item, priority in entries if item not in model]
+            heap.push_many(entries)
+            model.update(entries)
+        else:
+            lowest = min(model, key=model.get)
+            assert heap.peek() == lowest
+            assert heap.pop() == lowest
+            del model[lowest]
+        assert len(heap) == len(model)
+        if step % 100 == 0:
+            assert sorted(heap) == sorted(model)
+            assert all(heap.priority(item) == priority for item, priority in model.items())
+    order = [heap.pop() for _ in range(len(heap))]
+    assert order == sorted(model, key=model.get)
+
+
+def test_heap_errors():
+    heap = ArrayHeap()
+    with pytest.raises(IndexError):
+        heap.pop()
+    heap.heapify([("a", 3), ("b", 1), ("c", 2)])
+    with pytest.raises(KeyError):
+        heap.update("d", 0)
+    with pytest.raises(ValueError):
+        heap.decrease_key("b", 5)
+    with pytest.raises(ValueError):
+        heap.heapify([("a", 1), ("a", 2)])
+    assert [heap.pop() for _ in range(3)] == ["b", "c", "a"]
+
+
+@requires_numpy
+@pytest.mark.parametrize("dtype", ["int64", "int32", "float64"])
+def test_numpy_array_list_matches_list(dtype):
+    rng = random.Random(0)
+    numpy_list = NumpyArrayList(dtype=dtype)
+    model = []
+    for _ in range(200):
+        items = [rng.randrange(-50, 50) for _ in range(rng.randrange(5))]
+        if rng.random() < 0.5:
+            numpy_list.extend(items)
+            model.extend(items)
+        else:
+            index = rng.randrange(len(model) + 1)
+            numpy_list.insert_many(index, items)
+            model[index:index] = items
+        if model and rng.random() < 0.3:
+            index = rng.randrange(len(model))
+            assert numpy_list.delete_at_index(index) == model.pop(index)
+    assert list(numpy_list) == model
+    for item in range(-55, 55):
+        assert numpy_list.count(item) == model.count(item)
+        assert (item in numpy_list) == (item in model)
+        if item in model:
+            assert numpy_list.index(item) == model.index(item)
+        else:
+            with pytest.raises(KeyError):
+                numpy_list.index(item)
+    assert numpy_list.min() == min(model)
+    assert numpy_list.max() == max(model)
+    assert numpy_list.sum() == sum(model)
+    assert list(numpy_list.filter(lambda array: array % 2 == 0)) == [item for item in model if item % 2 == 0]
+    assert list(numpy_list[3:40:3]) == model[3:40:3]
+
+
+@requires_numpy
+def test_numpy_array_list_empty_and_aliasing():
+    numpy_list = NumpyArrayList()
+    with pytest.raises(ValueError):
+        numpy_list.min()
+    with pytest.raises(ValueError):
+        numpy_list.max()
+    assert numpy_list.sum() == 0
+    numpy_list.extend(range(5))
+    numpy_list.insert_many(0, numpy_list.as_numpy()[2:4])
+    assert list(numpy_list) == [2, 3, 0, 1, 2, 3, 4]
+    numpy_list.extend(numpy_list.as_numpy())
+    assert list(numpy_list) == [2, 3, 0, 1, 2, 3, 4] * 2
+    numpy_list.insert_many(1, numpy_list.view()[:2])
+    assert list(numpy_list)[:4] == [2, 2, 3, 3]
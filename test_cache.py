@@ -0,0 +1,185 @@
+import collections
+import random
+
+import pytest
+
+import cache
+from cache import Cache, memoize
+
+
+class Clock:
+    """
+    Stands in for the time module, so entries expire without sleeping
+    """
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+def test_lru_matches_ordered_dict():
+    rng = random.Random(0)
+    lru = Cache(8)
+    model = collections.OrderedDict()
+    for _ in range(5000):
+        key = rng.randrange(20)
+        if rng.random() < 0.5:
+            assert lru.get(key) == model.get(key)
+            if key in model:
+                model.move_to_end(key)
+        else:
+            lru.put(key, -key)
+            model[key] = -key
+            model.move_to_end(key)
+            if len(model) > 8:
+                model.popitem(last=False)
+        assert len(lru) == len(model)
+        assert lru.weight == len(model)
+    assert [entry.key for entry in lru.order] == list(reversed(model))
+
+
+def test_lru_evicts_least_recently_used():
+    evicted = []
+    lru = Cache(3, on_evict=lambda key, item: evicted.append((key, item)))
+    for key in "abc":
+        lru[key] = key.upper()
+    assert lru["a"] == "A"
+    lru["d"] = "D"
+    assert evicted == [("b", "B")]
+    lru["c"] = "C2"
+    lru["e"] = "E"
+    assert evicted == [("b", "B"), ("a", "A")]
+    assert "c" in lru and "d" in lru and "e" in lru
+    assert lru.stats.evictions == 2
+    with pytest.raises(KeyError):
+        lru["b"]
+
+
+def test_lfu_evicts_least_frequent_then_least_recent():
+    evicted = []
+    lfu = Cache(3, policy=Cache.LFU, on_evict=lambda key, item: evicted.append(key))
+    for key in "abc":
+        lfu[key] = key
+    lfu.get("a")
+    lfu.get("a")
+    lfu.get("b")
+    lfu.get("c")
+    lfu["d"] = "d"
+    assert evicted == ["b"]
+    lfu["e"] = "e"
+    assert evicted == ["b", "d"]
+    lfu.get("e")
+    lfu.get("e")
+    lfu["f"] = "f"
+    assert evicted == ["b", "d", "c"]
+    assert sorted(key for key in "abcdef" if key in lfu) == ["a", "e", "f"]
+    assert [bucket.frequency for bucket in lfu.order] == [1, 3]
+
+
+def test_lfu_matches_model():
+    rng = random.Random(1)
+    lfu = Cache(6, policy=Cache.LFU)
+    counts = {}
+    last_use = {}
+    for step in range(5000):
+        key = rng.randrange(15)
+        if rng.random() < 0.6:
+            assert lfu.get(key) == (-key if key in counts else None)
+            if key in counts:
+                counts[key] += 1
+                last_use[key] = step
+        else:
+            if key not in counts and len(counts) == 6:
+                victim = min(counts, key=lambda k: (counts[k], last_use[k]))
+                del counts[victim]
+                del last_use[victim]
+            counts[key] = 1
+            last_use[key] = step
+            lfu.put(key, -key)
+        assert sorted(key for key in range(15) if key in lfu) == sorted(counts)
+
+
+def test_ttl_expiry(clock):
+    evicted = []
+    ttl = Cache(10, ttl=5, on_evict=lambda key, item: evicted.append(key))
+    ttl["a"] = 1
+    clock.now = 3
+    ttl["b"] = 2
+    assert ttl.get("a") == 1
+    clock.now = 5
+    assert "a" not in ttl
+    assert ttl.get("a") is None
+    assert evicted == ["a"]
+    assert ttl.get("b") == 2
+    ttl["c"] = 3
+    clock.now = 9
+    assert ttl.purge_expired() == 1
+    assert evicted == ["a", "b"]
+    assert len(ttl) == 1 and ttl.get("c") == 3
+    clock.now = 10
+    assert ttl.purge_expired() == 1
+    assert ttl.is_empty()
+    assert ttl.stats.expirations == 3
+    assert Cache(10).purge_expired() == 0
+
+
+def test_ttl_expiry_with_lfu(clock):
+    lfu = Cache(10, policy=Cache.LFU, ttl=1)
+    lfu["a"] = 1
+    lfu.get("a")
+    lfu["b"] = 2
+    clock.now = 1
+    assert lfu.purge_expired() == 2
+    assert lfu.is_empty() and lfu.weight == 0
+    assert lfu.order.is_empty()
+
+
+def test_weigher_bounds_total_weight():
+    evicted = []
+    weighed = Cache(10, weigher=lambda key, item: len(item), on_evict=lambda key, item: evicted.append(key))
+    weighed["a"] = "xxxx"
+    weighed["b"] = "xxxx"
+    weighed["c"] = "xx"
+    assert weighed.weight == 10 and evicted == []
+    weighed["d"] = "xxxxxx"
+    assert evicted == ["a", "b"]
+    assert weighed.weight == 8
+    weighed["c"] = "xxxxxx"
+    assert evicted == ["a", "b", "d"]
+    assert weighed.weight == 6
+    weighed["e"] = "x" * 11
+    assert "e" not in weighed
+    assert weighed.weight == 6 and len(weighed) == 1
+
+
+def test_memoize_keys_on_keyword_arguments():
+    calls = []
+
+    @memoize(capacity=16)
+    def scale(value, factor=2, offset=0):
+        calls.append((value, factor, offset))
+        return value * factor + offset
+
+    assert scale(3) == 6
+    assert scale(3) == 6
+    assert scale(3, factor=3) == 9
+    assert scale(3, offset=1, factor=3) == 10
+    assert scale(3, factor=3, offset=1) == 10
+    assert scale(3, 3) == 9
+    assert calls == [(3, 2, 0), (3, 3, 0), (3, 3, 1), (3, 3, 0)]
+    assert scale.cache.stats.hits == 2
+    assert scale.cache.stats.misses == 4
+    assert scale.__name__ == "scale"
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        Cache(4, policy="fifo")
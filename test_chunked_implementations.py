@@ -0,0 +1,71 @@
+import bisect
+import random
+
+import pytest
+
+from chunked_implementations import ChunkedSortedList
+
+
+def check(sorted_list, model):
+    assert len(sorted_list) == len(model)
+    assert list(sorted_list) == model
+    assert all(len(sublist) <= 2 * sorted_list.load for sublist in sorted_list.lists)
+    assert all(sublist for sublist in sorted_list.lists)
+    assert sorted_list.maxes == [sublist[-1] for sublist in sorted_list.lists]
+
+
+@pytest.mark.parametrize("load", [1, 2, 5, 64])
+def test_matches_sorted_list_model(load):
+    rng = random.Random(load)
+    sorted_list = ChunkedSortedList(load)
+    model = []
+    for step in range(2000):
+        operation = rng.random()
+        if operation < 0.4 or not model:
+            item = rng.randrange(500)
+            sorted_list.add(item)
+            bisect.insort(model, item)
+        elif operation < 0.45:
+            items = [rng.randrange(500) for _ in range(rng.choice([1, 3, 50, 200]))]
+            sorted_list.add_many(items)
+            model = sorted(model + items)
+        elif operation < 0.65:
+            index = rng.randrange(-len(model), len(model))
+            assert sorted_list[index] == model[index]
+            sorted_list.delete_at_index(index)
+            del model[index]
+        elif operation < 0.8:
+            item = rng.randrange(500)
+            if item in model:
+                sorted_list.remove(item)
+                model.remove(item)
+            else:
+                with pytest.raises(KeyError):
+                    sorted_list.remove(item)
+        else:
+            item = rng.randrange(-10, 510)
+            assert sorted_list.bisect_left(item) == bisect.bisect_left(model, item)
+            assert sorted_list.bisect_right(item) == bisect.bisect_right(model, item)
+            assert (item in sorted_list) == (item in model)
+            if item in model:
+                assert sorted_list.index(item) == model.index(item)
+            low, high = sorted((item, rng.randrange(-10, 510)))
+            assert list(sorted_list.irange(low, high)) == [x for x in model if low <= x <= high]
+        if step % 200 == 0:
+            check(sorted_list, model)
+            for index in range(-len(model), len(model)):
+                assert sorted_list[index] == model[index]
+    check(sorted_list, model)
+
+
+def test_index_out_of_bounds():
+    sorted_list = ChunkedSortedList(2)
+    sorted_list.add_many(range(10))
+    for index in (10, 11, -11):
+        with pytest.raises(IndexError):
+            sorted_list[index]
+    assert sorted_list[-10] == 0
+    sorted_list.clear()
+    assert len(sorted_list) == 0
+    with pytest.raises(IndexError):
+        sorted_list[0]
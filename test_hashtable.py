@@ -0,0 +1,75 @@
+import random
+
+from cache import memoize
+from hashtable import HashTable
+
+
+class WeakHash:
+    """
+    Key whose hash has only 4 distinct values
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 4
+
+    def __eq__(self, other):
+        return isinstance(other, WeakHash) and other.value == self.value
+
+
+def capacity(table):
+    return len(table.table_one) + len(table.table_two)
+
+
+def test_matches_dict():
+    rng = random.Random(0)
+    table = HashTable()
+    model = {}
+    for _ in range(20000):
+        key = rng.randrange(2000)
+        if rng.random() < 0.7:
+            table[key] = key * 2
+            model[key] = key * 2
+        elif key in model:
+            del table[key]
+            del model[key]
+        assert (key in table) == (key in model)
+    assert len(table) == len(model)
+    assert sorted(table.items()) == sorted(model.items())
+
+
+def test_equal_hashes_do_not_grow_tables():
+    modulus = 2 ** 61 - 1
+    keys = [5 + i * modulus for i in range(200)]
+    assert len({hash(key) for key in keys}) == 1
+    table = HashTable()
+    for key in keys:
+        table[key] = key
+    assert len(table) == len(keys)
+    assert capacity(table) <= 4 * len(keys)
+    assert all(table.get(key) == key for key in keys)
+    for key in keys[::2]:
+        del table[key]
+    assert len(table) == len(keys) // 2
+    assert all((key in table) == (i % 2 == 1) for i, key in enumerate(keys))
+
+
+def test_memoize_with_weak_hash_is_bounded():
+    @memoize(capacity=100)
+    def value(key):
+        return key.value
+
+    for i in range(1000):
+        assert value(WeakHash(i % 150)) == i % 150
+    table = value.cache.table
+    assert len(table) == 100
+    assert capacity(table) <= 4 * 150
+
+
+def test_load_factor():
+    table = HashTable()
+    for i in range(50000):
+        table["key{}".format(i)] = i
+    assert len(table) / capacity(table) > 0.2
+    assert all(table["key{}".format(i)] == i for i in range(0, 50000, 97))
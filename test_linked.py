@@ -0,0 +1,61 @@
+import pickle
+import random
+
+import pytest
+
+from linked_implmentations import LinkedList, DoublyLinkedList, DoubleNode
+
+
+def test_linked_list_matches_list():
+    rng = random.Random(0)
+    linked_list = LinkedList()
+    model = []
+    for _ in range(2000):
+        operation = rng.random()
+        if operation < 0.3 or not model:
+            index = rng.randrange(len(model) + 1)
+            linked_list.insert(-index, index)
+            model.insert(index, -index)
+        elif operation < 0.45:
+            items = [rng.randrange(100) for _ in range(rng.randrange(5))]
+            linked_list.extend(items)
+            model.extend(items)
+        elif operation < 0.6:
+            index = rng.randrange(len(model))
+            linked_list[index] = -index
+            model[index] = -index
+        elif operation < 0.8:
+            index = rng.randrange(len(model))
+            assert linked_list.delete_at_index(index) == model.pop(index)
+        else:
+            item = rng.randrange(100)
+            if item in model:
+                assert linked_list.index(item) == model.index(item)
+                linked_list.remove(item)
+                model.remove(item)
+            else:
+                assert item not in linked_list
+                with pytest.raises(KeyError):
+                    linked_list.remove(item)
+        assert len(linked_list) == len(model)
+    assert list(linked_list) == model
+    assert str(linked_list) == str(model)
+
+
+def test_long_linked_list_pickles():
+    linked_list = LinkedList()
+    linked_list.extend(range(100000))
+    assert list(pickle.loads(pickle.dumps(linked_list))) == list(range(100000))
+
+
+def test_doubly_linked_list():
+    nodes = [DoubleNode(item) for item in range(5)]
+    linked_list = DoublyLinkedList()
+    for node in nodes:
+        linked_list.push_back(node)
+    linked_list.move_to_front(nodes[3])
+    linked_list.unlink(nodes[1])
+    assert [node.item for node in linked_list] == [3, 0, 2, 4]
+    assert linked_list.pop_back() is nodes[4]
+    assert linked_list.front() is nodes[3]
+    assert len(linked_list) == 3
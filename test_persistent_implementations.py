@@ -0,0 +1,126 @@
+import pickle
+import random
+
+import pytest
+
+from persistent_implementations import PersistentVector, TransientVector, PersistentQueue, WIDTH
+
+
+def check_vector(vector, model):
+    assert len(vector) == len(model)
+    assert list(vector) == model
+    for index in range(0, len(model), max(1, len(model) // 50)):
+        assert vector[index] == model[index]
+
+
+@pytest.mark.parametrize("size", [0, 1, WIDTH - 1, WIDTH, WIDTH + 1, WIDTH * WIDTH + WIDTH + 1, 3000])
+def test_append_and_pop_across_levels(size):
+    versions = [PersistentVector()]
+    for item in range(size):
+        versions.append(versions[-1].append(item))
+    for length, vector in enumerate(versions):
+        check_vector(vector, list(range(length)))
+    vector = versions[-1]
+    for length in range(size, 0, -1):
+        vector = vector.pop()
+        assert len(vector) == length - 1
+        if length % 97 == 0 or length < 2 * WIDTH:
+            check_vector(vector, list(range(length - 1)))
+    check_vector(versions[-1], list(range(size)))
+
+
+def test_old_versions_are_unchanged():
+    rng = random.Random(0)
+    versions = [(PersistentVector(), [])]
+    for _ in range(3000):
+        vector, model = rng.choice(versions)
+        operation = rng.random()
+        if operation < 0.45 or not model:
+            item = rng.random()
+            versions.append((vector.append(item), model + [item]))
+        elif operation < 0.75:
+            index = rng.randrange(len(model))
+            item = rng.random()
+            versions.append((vector.set(index, item), model[:index] + [item] + model[index + 1:]))
+        elif operation < 0.9:
+            versions.append((vector.pop(), model[:-1]))
+        elif operation < 0.95:
+            index = rng.randrange(len(model) + 1)
+            versions.append((vector.insert(-1.0, index), model[:index] + [-1.0] + model[index:]))
+        else:
+            index = rng.randrange(len(model))
+            versions.append((vector.delete_at_index(index), model[:index] + model[index + 1:]))
+    for vector, model in versions:
+        check_vector(vector, model)
+
+
+def test_transient_batches_do_not_touch_the_source():
+    rng = random.Random(1)
+    source = PersistentVector(range(2000))
+    transient = source.transient()
+    model = list(range(2000))
+    for _ in range(5000):
+        operation = rng.random()
+        if operation < 0.4:
+            index = rng.randrange(len(model))
+            transient[index] = -index
+            model[index] = -index
+        elif operation < 0.7:
+            transient.append(len(model))
+            model.append(len(model))
+        else:
+            assert transient.pop() == model.pop()
+    vector = transient.persistent()
+    check_vector(vector, model)
+    check_vector(source, list(range(2000)))
+    with pytest.raises(RuntimeError):
+        transient.append(0)
+    with pytest.raises(TypeError):
+        vector[0] = 1
+
+
+def test_vector_errors_and_pickling():
+    vector = PersistentVector(range(100))
+    with pytest.raises(IndexError):
+        vector.set(100, 0)
+    with pytest.raises(IndexError):
+        PersistentVector().pop()
+    assert vector.index(50) == 50
+    assert list(vector.remove(50)) == [item for item in range(100) if item != 50]
+    assert list(vector.extend(range(100, 150))) == list(range(150))
+    assert list(pickle.loads(pickle.dumps(vector))) == list(range(100))
+    assert isinstance(TransientVector(vector), TransientVector)
+
+
+def test_queue_versions():
+    rng = random.Random(2)
+    versions = [(PersistentQueue(), [])]
+    for _ in range(5000):
+        queue, model = rng.choice(versions[-20:] if rng.random() < 0.8 else versions)
+        if rng.random() < 0.55 or not model:
+            item = rng.random()
+            versions.append((queue.append(item), model + [item]))
+        else:
+            assert queue.peek() == model[0]
+            item, rest = queue.serve()
+            assert item == model[0]
+            versions.append((rest, model[1:]))
+    for queue, model in versions:
+        assert len(queue) == len(model)
+        assert list(queue) == model
+
+
+def test_queue_bulk_operations():
+    queue = PersistentQueue(range(10))
+    items, rest = queue.serve_many(4)
+    assert items == [0, 1, 2, 3]
+    assert list(rest) == list(range(4, 10))
+    assert list(rest.extend(range(10, 13))) == list(range(4, 13))
+    assert list(queue) == list(range(10))
+    with pytest.raises(IndexError):
+        queue.serve_many(11)
+    with pytest.raises(ValueError):
+        queue.serve_many(-1)
+    with pytest.raises(IndexError):
+        PersistentQueue().serve()
+    assert list(pickle.loads(pickle.dumps(rest))) == list(range(4, 10))
@@ -0,0 +1,26 @@
+import profiling
+from array_implementations import ArrayHeap, SortedArrayList
+
+
+def test_override_calling_base_method_counts_once():
+    profiling.enable()
+    try:
+        heap = ArrayHeap()
+        heap.push_many([("a", 1), ("b", 2)])
+        heap.push_many([("c", 3)])
+    finally:
+        profiling.disable()
+    assert profiling.stats(heap).calls["push_many"] == 2
+    assert profiling.stats(heap).calls["push"] == 1
+
+
+def test_sorted_adds_count_moved_items():
+    sorted_list = SortedArrayList(10)
+    profiling.enable(sorted_list)
+    for item in [5, 1, 3, 2]:
+        sorted_list.add(item)
+    assert profiling.stats(sorted_list).moved == 4
+    sorted_list.add_many([0, 4])
+    assert profiling.stats(sorted_list).moved == 8
+    profiling.disable(sorted_list)
+    assert list(sorted_list) == [0, 1, 2, 3, 4, 5]
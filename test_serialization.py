@@ -0,0 +1,149 @@
+import io
+import pickle
+
+import pytest
+
+import serialization
+from array_implementations import ArrayStack, LinearQueue, CircularQueue, ArrayList, NumpyArrayList, \
+    SortedArrayList, ArrayHeap, np
+from hashtable import HashTable
+from linked_implmentations import LinkedList
+from persistent_implementations import PersistentVector, PersistentQueue
+from trie import Trie
+
+
+def containers():
+    array_list = ArrayList(100)
+    array_list.extend(["a", 1, None, 2.5])
+    yield array_list
+    typed = ArrayList(100, "q")
+    typed.extend([-2 ** 63, -1, 0, 2 ** 63 - 1])
+    yield typed
+    doubles = ArrayList(typecode="d")
+    doubles.extend([0.5, -1.25])
+    yield doubles
+    yield ArrayList(typecode="q")
+    if np is not None:
+        numpy_list = NumpyArrayList(100, "int32")
+        numpy_list.extend(range(7))
+        yield numpy_list
+        yield NumpyArrayList()
+    stack = ArrayStack(50)
+    stack.push_many("abc")
+    yield stack
+    linear = LinearQueue()
+    linear.extend(range(20))
+    linear.serve_many(15)
+    yield linear
+    circular = CircularQueue(8)
+    circular.extend(range(6))
+    circular.serve_many(5)
+    circular.extend(range(6, 12))
+    yield circular
+    sorted_list = SortedArrayList()
+    sorted_list.add_many([5, 1, 3])
+    yield sorted_list
+    yield SortedArrayList()
+    heap = ArrayHeap(arity=4)
+    heap.push_many([("h", 3), ("e", 1), ("a", 4), ("l", 2)])
+    yield heap
+    linked = LinkedList()
+    linked.extend(range(20000))
+    yield linked
+    table = HashTable()
+    for i in range(300):
+        table["k{}".format(i)] = i
+    yield table
+    yield Trie(["taco", "taro", "tarot", "", "coco"])
+    yield PersistentVector(range(100))
+    yield PersistentQueue(range(40)).append(99).serve()[1]
+
+
+def contents(container):
+    if isinstance(container, HashTable):
+        return sorted(container.items())
+    return list(container)
+
+
+def check(original, loaded):
+    assert type(loaded) is type(original)
+    assert len(loaded) == len(original)
+    assert contents(loaded) == contents(original)
+    if isinstance(original, ArrayList):
+        assert loaded.typecode == original.typecode
+        loaded.append(1)
+        loaded.insert(0, 2)
+        assert list(loaded) == [2] + contents(original) + [1]
+
+
+def raw(buffer):
+    return buffer.raw()
+
+
+def copied(buffer):
+    return bytearray(buffer.raw())
+
+
+@pytest.mark.parametrize("protocol", [2, 4, 5])
+def test_in_band(protocol):
+    for container in containers():
+        check(container, pickle.loads(pickle.dumps(container, protocol=protocol)))
+
+
+@pytest.mark.parametrize("transform", [None, raw, copied])
+def test_out_of_band(transform):
+    for container in containers():
+        buffers = []
+        data = pickle.dumps(container, protocol=5, buffer_callback=buffers.append)
+        if isinstance(container, ArrayList) and container.typecode is not None:
+            assert len(buffers) == 1
+        if transform is not None:
+            buffers = [transform(buffer) for buffer in buffers]
+        check(container, pickle.loads(data, buffers=buffers))
+
+
+def test_only_live_items_are_pickled():
+    empty = ArrayList(10 ** 5)
+    assert len(pickle.dumps(empty)) < 100
+    queue = LinearQueue(10 ** 4)
+    queue.extend(range(10 ** 4))
+    queue.serve_many(10 ** 4 - 1)
+    assert len(pickle.dumps(queue)) < 100
+
+
+def test_dump_and_load_all():
+    file = io.BytesIO()
+    originals = list(containers())
+    written = sum(serialization.dump(container, file) for container in originals)
+    assert written == len(file.getvalue())
+    file.seek(0)
+    loaded = list(serialization.load_all(file))
+    assert len(loaded) == len(originals)
+    for original, container in zip(originals, loaded):
+        check(original, container)
+
+
+def test_loaded_numpy_list_wraps_buffer():
+    if np is None:
+        pytest.skip("numpy is not installed")
+    numpy_list = NumpyArrayList()
+    numpy_list.extend(range(1000))
+    file = io.BytesIO()
+    serialization.dump(numpy_list, file)
+    file.seek(0)
+    loaded = serialization.load(file)
+    assert not loaded.array.flags.owndata
+    loaded[0] = 5
+    assert loaded[0] == 5 and numpy_list[0] == 0
+
+
+def test_truncated_record():
+    file = io.BytesIO()
+    typed = ArrayList(typecode="q")
+    typed.extend(range(10))
+    serialization.dump(typed, file)
+    with pytest.raises(EOFError):
+        serialization.load(io.BytesIO())
+    for cut in (3, 20, len(file.getvalue()) - 1):
+        with pytest.raises(pickle.UnpicklingError):
+            serialization.load(io.BytesIO(file.getvalue()[:cut]))
@@ -0,0 +1,242 @@
+import array
+import functools
+import random
+
+import pytest
+
+import sorts
+from array_implementations import ArrayList, ArrayStack, LinearQueue, CircularQueue, SortedArrayList, np
+
+requires_numpy = pytest.mark.skipif(np is None, reason="numpy is not installed")
+
+
+@functools.total_ordering
+class Record:
+    """
+    Item ordered by key only, so the order of equal items can be observed
+    """
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __repr__(self):
+        return "Record({}, {})".format(self.key, self.tag)
+
+
+def patterns(rng, size):
+    """
+    Inputs that exercise introsort, the run detection and the galloping merges
+    """
+    yield [rng.randrange(size * 2 + 1) for _ in range(size)]
+    yield [rng.randrange(4) for _ in range(size)]
+    yield list(range(size))
+    yield list(range(size, 0, -1))
+    runs = []
+    while len(runs) < size:
+        runs.extend(sorted(rng.randrange(1000) for _ in range(rng.randrange(1, 200))))
+    yield runs[:size]
+    yield list(range(size // 2)) + list(range(size // 2, size // 2 - size, -1))
+    sawtooth = list(range(size))
+    for _ in range(size // 50):
+        i = rng.randrange(size)
+        j = rng.randrange(size)
+        sawtooth[i], sawtooth[j] = sawtooth[j], sawtooth[i]
+    yield sawtooth
+
+
+SIZES = [0, 1, 2, 15, 16, 17, 31, 32, 33, 100, 1000, 5000]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sort_matches_sorted(size):
+    rng = random.Random(size)
+    for items in patterns(rng, size):
+        for reverse in (False, True):
+            for stable in (False, True):
+                array = list(items)
+                sorts.sort(array, reverse=reverse, stable=stable)
+                assert array == sorted(items, reverse=reverse)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sort_is_stable(size):
+    rng = random.Random(size)
+    for items in patterns(rng, size):
+        records = [Record(key % 7, tag) for tag, key in enumerate(items)]
+        for reverse in (False, True):
+            array = list(records)
+            sorts.sort(array, reverse=reverse, stable=True)
+            assert [record.tag for record in array] == \
+                [record.tag for record in sorted(records, reverse=reverse)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sort_with_key(size):
+    rng = random.Random(size)
+    for items in patterns(rng, size):
+        records = [Record(None, tag) for tag in items]
+        for reverse in (False, True):
+            array = list(records)
+            sorts.sort(array, key=lambda record: record.tag % 10, reverse=reverse)
+            expected = sorted(records, key=lambda record: record.tag % 10, reverse=reverse)
+            assert [id(record) for record in array] == [id(record) for record in expected]
+
+
+def test_sort_containers():
+    rng = random.Random(0)
+    items = [rng.randrange(100) for _ in range(300)]
+
+    array_list = ArrayList(500)
+    array_list.extend(items)
+    sorts.sort(array_list, reverse=True)
+    assert list(array_list) == sorted(items, reverse=True)
+
+    stack = ArrayStack(500)
+    stack.push_many(items)
+    sorts.sort(stack, key=lambda item: -item)
+    assert list(stack) == sorted(items, key=lambda item: -item)
+
+    queue = LinearQueue(500)
+    queue.extend(range(50))
+    queue.serve_many(50)
+    queue.extend(items)
+    sorts.sort(queue)
+    assert list(queue) == sorted(items)
+    assert queue.serve_many(len(items)) == sorted(items)
+
+
+@pytest.mark.parametrize("front", [0, 1, 150, 299, 399])
+def test_sort_wrapped_circular_queue(front):
+    rng = random.Random(front)
+    queue = CircularQueue(400)
+    queue.extend([None] * front)
+    queue.serve_many(front)
+    items = [rng.randrange(50) for _ in range(350)]
+    queue.extend(items)
+    sorts.sort(queue, stable=True)
+    assert list(queue) == sorted(items)
+    queue.extend([-1, -2])
+    assert queue.serve_many(len(queue)) == sorted(items) + [-1, -2]
+
+
+def test_sorted_list_is_rejected():
+    with pytest.raises(TypeError):
+        sorts.sort(SortedArrayList())
+
+
+def test_permute_follows_cycles():
+    rng = random.Random(0)
+    for size in (0, 1, 2, 10, 100):
+        permutation = list(range(size))
+        rng.shuffle(permutation)
+        array = ["x"] * 3 + [rng.random() for _ in range(size)]
+        expected = array[:3] + [array[3 + source] for source in permutation]
+        sorts._permute(array, 3, list(permutation))
+        assert array == expected
+
+
+def last_digit(item):
+    return item % 10
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_external_sort_matches_sorted(workers, typecode):
+    rng = random.Random(workers)
+    items = [rng.randrange(-10 ** 6, 10 ** 6) for _ in range(3000)]
+    for run_size in (1, 7, 1000, 5000):
+        result = sorts.external_sort(items, run_size, typecode=typecode, workers=workers)
+        assert list(result) == sorted(items)
+    assert list(sorts.external_sort([], 10, typecode=typecode, workers=workers)) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_external_sort_with_key_is_stable(workers):
+    rng = random.Random(workers)
+    items = [rng.randrange(1000) for _ in range(2000)]
+    result = sorts.external_sort(items, 300, key=last_digit, workers=workers)
+    assert list(result) == sorted(items, key=last_digit)
+
+
+def test_external_sort_reads_a_file(tmp_path):
+    rng = random.Random(0)
+    items = array.array("d", (rng.uniform(-1, 1) for _ in range(2500)))
+    path = tmp_path / "records"
+    with open(path, "wb") as file:
+        items.tofile(file)
+    assert list(sorts.external_sort(path, 400, typecode="d", workers=1, temp_dir=tmp_path)) == sorted(items)
+    assert list(sorts.external_sort(str(path), 400, typecode="d", workers=2)) == sorted(items)
+    with pytest.raises(ValueError):
+        list(sorts.external_sort(path, 400))
+
+
+def integer_keys(rng, dtype):
+    info = np.iinfo(dtype)
+    size = 2000
+    yield np.array([rng.randint(info.min, info.max) for _ in range(size)], dtype=dtype)
+    yield np.array([rng.randrange(50) for _ in range(size)], dtype=dtype)
+    yield np.array([info.min, info.max, 0, info.max, info.min, 1] * 5, dtype=dtype)
+    yield np.array([], dtype=dtype)
+    yield np.array([7], dtype=dtype)
+
+
+@requires_numpy
+@pytest.mark.parametrize("dtype", ["int8", "int32", "int64", "uint16", "uint64"])
+def test_radix_argsort_matches_stable_argsort(dtype):
+    rng = random.Random(dtype)
+    for keys in integer_keys(rng, dtype):
+        expected = np.argsort(keys, kind="stable")
+        for digit_bits in (1, 5, 8, 16):
+            assert sorts.radix_argsort(keys, digit_bits).tolist() == expected.tolist()
+        assert sorts.radix_sort(keys).tolist() == sorted(keys.tolist())
+        assert sorts.radix_sort(keys).dtype == keys.dtype
+
+
+@requires_numpy
+def test_counting_sort_matches_sorted():
+    rng = random.Random(0)
+    for keys in ([rng.randrange(-100, 100) for _ in range(1000)], [3, 1, 2], []):
+        assert sorts.counting_sort(np.array(keys, dtype=np.int64)).tolist() == sorted(keys)
+    keys = np.array([2 ** 64 - 1, 2 ** 64 - 3, 2 ** 64 - 2], dtype=np.uint64)
+    assert sorts.counting_sort(keys).tolist() == sorted(keys.tolist())
+    with pytest.raises(TypeError):
+        sorts.counting_sort([1.5, 2.5])
+
+
+@requires_numpy
+def test_radix_sort_errors():
+    with pytest.raises(ValueError):
+        sorts.radix_argsort([1, 2], 0)
+    with pytest.raises(ValueError):
+        sorts.radix_argsort([1, 2], 17)
+    with pytest.raises(TypeError):
+        sorts.radix_argsort(["a", "b"])
+
+
+@requires_numpy
+def test_radix_sort_pairs_is_stable():
+    rng = random.Random(0)
+    pairs = [(rng.randrange(-2 ** 63, 2 ** 63) if tag % 3 else rng.randrange(-5, 5), tag) for tag in range(2000)]
+    assert sorts.radix_sort_pairs(pairs) == sorted(pairs, key=lambda pair: pair[0])
+    assert sorts.radix_sort_pairs([]) == []
+
+
+@requires_numpy
+def test_msd_radix_sort_matches_sorted():
+    rng = random.Random(0)
+    alphabet = "ab\u00e9\u4e2d"
+    for size in (0, 1, 2, sorts.MSD_CUTOFF, sorts.MSD_CUTOFF + 1, 3000):
+        strings = ["".join(rng.choice(alphabet) for _ in range(rng.randrange(8))) for _ in range(size)]
+        assert sorts.msd_radix_sort(strings) == sorted(strings)
+        assert sorts.msd_radix_sort(strings, width=32) == sorted(strings)
+    prefixes = ["abc" * length for length in range(40)] * 2
+    rng.shuffle(prefixes)
+    assert sorts.msd_radix_sort(prefixes) == sorted(prefixes)
+    with pytest.raises(ValueError):
+        sorts.msd_radix_sort(["abcd"], width=3)
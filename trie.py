@@ -1,9 +1,12 @@
 __author__ = "Sadeeptha Bandara"
 
+from adts import render
+
 
 class Trie:
-    def __init__(self, init_words):
+    def __init__(self, init_words=()):
         self.root = Node()
+        self.length = 0
         for word in init_words:
             self.insert(word)
 
@@ -14,7 +17,9 @@ class Trie:
             if current.link[index] is None:
                 current.link[index] = Node()
             current = current.link[index]
-        current.link[0] = Node()
+        if current.link[0] is None:
+            current.link[0] = Node()
+            self.length += 1
 
     def search(self, word: str):
         current = self.root
@@ -28,9 +33,33 @@ class Trie:
     def inorder_traversal(self, source):
         pass
 
+    def __contains__(self, word: str):
+        return self.search(word)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """
+        Yields the words in alphabetical order, depth first
+        """
+        stack = [(self.root, "")]
+        while stack:
+            current, prefix = stack.pop()
+            if current.link[0] is not None:
+                yield prefix
+            for index in range(Node.ALPHABET_SIZE - 1, 0, -1):
+                if current.link[index] is not None:
+                    stack.append((current.link[index], prefix + chr(index + 96)))
+
     def __str__(self):
-        current = self.root
-        pass
+        return render(self, len(self))
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickles the words, rather than a node of 27 links per letter
+        """
+        return type(self), (list(self),)
 
 
 class Node: